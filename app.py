@@ -25,9 +25,8 @@ class MainWindow(SmartMainWindow):
             open_translations_callback=self.open_translations_window
         )
         
-        # Apply global styling
-        self.setStyleSheet(AppStyle.get_global_stylesheet())
-        self.setPalette(AppStyle.apply_theme_to_palette(self.palette()))
+        # The global stylesheet is applied once on the QApplication
+        self.setPalette(AppStyle.get_palette())
         
         # Create central widget and main layout
         central_widget = QWidget()
@@ -136,7 +135,7 @@ if __name__ == "__main__":
     
     # Apply global application styling
     app.setStyleSheet(AppStyle.get_global_stylesheet())
-    app.setPalette(AppStyle.apply_theme_to_palette(app.palette()))
+    app.setPalette(AppStyle.get_palette())
     
     window = MainWindow()
     window.show()
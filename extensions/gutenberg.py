@@ -25,6 +25,14 @@ class GutenbergBook:
     difficulty_level: Optional[int] = None
     last_accessed: Optional[float] = None
 
+    @property
+    def display_text(self) -> str:
+        """Display string for the book, reflecting its current fields."""
+        text = f"{self.title} - {', '.join(self.authors)}"
+        if self.word_count:
+            text += f" ({self.word_count} words)"
+        return text
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the book to a dictionary for serialization."""
         return {
@@ -67,6 +75,7 @@ class Gutenberg:
     
     def __init__(self):
         self.books: Dict[int, GutenbergBook] = {}
+        self._available_languages: Optional[List[str]] = None
         self._load_cache()
     
     def _load_cache(self):
@@ -226,12 +235,19 @@ class Gutenberg:
             return None
     
     def get_available_languages(self) -> List[str]:
-        """Get a list of available languages in Project Gutenberg."""
+        """Get a list of available languages in Project Gutenberg.
+        
+        The list is fetched once per client; failed lookups are retried.
+        """
+        if self._available_languages is not None:
+            return list(self._available_languages)
+        
         try:
             response = requests.get(f"{self.BASE_URL}/languages")
             response.raise_for_status()
             data = response.json()
-            return [lang["code"] for lang in data.get("results", [])]
+            self._available_languages = [lang["code"] for lang in data.get("results", [])]
+            return list(self._available_languages)
         except Exception as e:
             logger.error(f"Error getting available languages: {e}")
             return []
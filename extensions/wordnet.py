@@ -1,9 +1,12 @@
 """Module for interacting with WordNet's lexical database."""
 
-from typing import List, Dict, Optional, Any, Set
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import List, Dict, Optional, Any, FrozenSet, Tuple
+from dataclasses import asdict, dataclass
+from itertools import product
 from pathlib import Path
 import json
+import sys
 import time
 from nltk.corpus import wordnet as wn
 from nltk.corpus.reader.wordnet import Synset
@@ -13,7 +16,7 @@ from utils.logging_setup import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class WordInfo:
     """Represents word information from WordNet."""
     word: str
@@ -70,10 +73,17 @@ class WordNet:
     CACHE_DIR = Path("cache/wordnet")
     CACHE_FILE = CACHE_DIR / "words.json"
     CACHE_DURATION = 86400  # 24 hours in seconds
+    # Sizes of the in-memory lookup caches, which drop the least recently used entries
+    SYNSETS_CACHE_SIZE = 1024
+    SIMILARITY_CACHE_SIZE = 4096
+    RELATED_CACHE_SIZE = 256
     
     def __init__(self):
         """Initialize the WordNet client with caching."""
         self.words: Dict[str, WordInfo] = {}
+        self._related_cache: OrderedDict[Tuple[str, int, bool], FrozenSet[str]] = OrderedDict()
+        self._similarity_cache: OrderedDict[Tuple[str, str], float] = OrderedDict()
+        self._synsets_cache: OrderedDict[str, List[Synset]] = OrderedDict()
         self._load_cache()
     
     def _load_cache(self) -> Dict[str, Any]:
@@ -99,7 +109,7 @@ class WordNet:
             self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
             with open(self.CACHE_FILE, 'w', encoding='utf-8') as f:
                 json.dump(
-                    {word: word_info.__dict__ 
+                    {word: asdict(word_info) 
                      for word, word_info in self.words.items()},
                     f,
                     ensure_ascii=False,
@@ -114,6 +124,49 @@ class WordNet:
             return False
         return (time.time() - word_info.last_accessed) < self.CACHE_DURATION
     
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key) -> Any:
+        """Return a cached value, marking it as recently used, or None if missing."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+    
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key, value, size: int):
+        """Cache a value, dropping the least recently used entry beyond `size`."""
+        cache[key] = value
+        if len(cache) > size:
+            cache.popitem(last=False)
+    
+    def _synsets(self, word: str) -> List[Synset]:
+        """Return the synsets for a word, reusing recent lookups."""
+        synsets = self._cache_get(self._synsets_cache, word)
+        if synsets is None:
+            synsets = wn.synsets(word)
+            self._cache_put(self._synsets_cache, word, synsets, self.SYNSETS_CACHE_SIZE)
+        return synsets
+    
+    @staticmethod
+    def _path_similarity(syn1: Synset, syn2: Synset) -> Optional[float]:
+        """Return the path similarity of two synsets, or None if it can't be computed."""
+        try:
+            return syn1.path_similarity(syn2)
+        except Exception:
+            return None
+    
+    @classmethod
+    def _max_similarity(cls, synsets1: List[Synset], synsets2: List[Synset]) -> float:
+        """Return the maximum path similarity over all pairs of synsets.
+
+        A pair that fails to compare is skipped rather than failing the whole score.
+        """
+        return float(max(
+            filter(None, (cls._path_similarity(syn1, syn2)
+                          for syn1, syn2 in product(synsets1, synsets2))),
+            default=0.0
+        ))
+    
     def get_word_info(self, word: str) -> Optional[WordInfo]:
         """Get comprehensive information about a word."""
         # Check cache first
@@ -121,7 +174,7 @@ class WordNet:
             return self.words[word]
         
         try:
-            synsets = wn.synsets(word)
+            synsets = self._synsets(word)
             if not synsets:
                 return None
             
@@ -138,24 +191,24 @@ class WordNet:
             for synset in synsets:
                 definitions.extend(synset.definition().split('; '))
                 examples.extend(synset.examples())
-                synonyms.update(synset.lemma_names())
                 
-                # Get antonyms
+                # Get synonyms and antonyms in one pass over the lemmas
                 for lemma in synset.lemmas():
-                    antonyms.update(ant.name() for ant in lemma.antonyms())
+                    synonyms.add(sys.intern(lemma.name()))
+                    antonyms.update(sys.intern(ant.name()) for ant in lemma.antonyms())
                 
                 # Get hypernyms and hyponyms
-                hypernyms.update(s.name() for s in synset.hypernyms())
-                hyponyms.update(s.name() for s in synset.hyponyms())
+                hypernyms.update(sys.intern(s.name()) for s in synset.hypernyms())
+                hyponyms.update(sys.intern(s.name()) for s in synset.hyponyms())
                 
                 # Get meronyms and holonyms
-                meronyms.update(s.name() for s in synset.part_meronyms())
-                meronyms.update(s.name() for s in synset.substance_meronyms())
-                meronyms.update(s.name() for s in synset.member_meronyms())
+                meronyms.update(sys.intern(s.name()) for s in synset.part_meronyms())
+                meronyms.update(sys.intern(s.name()) for s in synset.substance_meronyms())
+                meronyms.update(sys.intern(s.name()) for s in synset.member_meronyms())
                 
-                holonyms.update(s.name() for s in synset.part_holonyms())
-                holonyms.update(s.name() for s in synset.substance_holonyms())
-                holonyms.update(s.name() for s in synset.member_holonyms())
+                holonyms.update(sys.intern(s.name()) for s in synset.part_holonyms())
+                holonyms.update(sys.intern(s.name()) for s in synset.substance_holonyms())
+                holonyms.update(sys.intern(s.name()) for s in synset.member_holonyms())
             
             # Create WordInfo object
             word_info = WordInfo(
@@ -260,43 +313,92 @@ class WordNet:
         return word_info.get_cleaned_holonyms() if cleaned else word_info.holonyms
     
     def get_word_similarity(self, word1: str, word2: str) -> float:
-        """Get similarity score between two words."""
+        """Get similarity score between two words.
+        
+        Uses the maximum NLTK path similarity over all synset pairs. Scores
+        are symmetric, so they are cached on the sorted word pair.
+        """
+        cache_key = (word1, word2) if word1 <= word2 else (word2, word1)
+        cached = self._cache_get(self._similarity_cache, cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            synsets1 = wn.synsets(word1)
-            synsets2 = wn.synsets(word2)
+            synsets1 = self._synsets(word1)
+            synsets2 = self._synsets(word2)
             
             if not synsets1 or not synsets2:
                 return 0.0
             
             # Get maximum similarity between any pair of synsets
-            max_similarity = 0.0
-            for syn1 in synsets1:
-                for syn2 in synsets2:
-                    try:
-                        similarity = syn1.path_similarity(syn2)
-                        if similarity and similarity > max_similarity:
-                            max_similarity = similarity
-                    except:
-                        continue
+            max_similarity = self._max_similarity(synsets1, synsets2)
             
+            self._cache_put(self._similarity_cache, cache_key, max_similarity,
+                            self.SIMILARITY_CACHE_SIZE)
             return max_similarity
             
         except Exception as e:
             logger.error(f"Error calculating word similarity: {e}")
             return 0.0
     
-    def get_related_words(self, word: str, depth: int = 2, cleaned: bool = True) -> Set[str]:
+    def get_word_similarities(self, word: str, candidates: List[str]) -> Dict[str, float]:
+        """Get similarity scores between a word and several candidate words.
+        
+        The synsets of the source word are looked up once and reused for
+        every candidate, and already cached pairs are not recomputed.
+        
+        Args:
+            word: The word to compare against
+            candidates: The words to score against `word`
+        """
+        similarities: Dict[str, float] = {}
+        try:
+            synsets = None
+            for candidate in candidates:
+                cache_key = (word, candidate) if word <= candidate else (candidate, word)
+                cached = self._cache_get(self._similarity_cache, cache_key)
+                if cached is not None:
+                    similarities[candidate] = cached
+                    continue
+                
+                if synsets is None:
+                    synsets = self._synsets(word)
+                candidate_synsets = self._synsets(candidate) if synsets else []
+                if not candidate_synsets:
+                    similarities[candidate] = 0.0
+                    continue
+                
+                similarity = self._max_similarity(synsets, candidate_synsets)
+                self._cache_put(self._similarity_cache, cache_key, similarity,
+                                self.SIMILARITY_CACHE_SIZE)
+                similarities[candidate] = similarity
+            
+            return similarities
+            
+        except Exception as e:
+            logger.error(f"Error calculating word similarities: {e}")
+            return {candidate: similarities.get(candidate, 0.0) for candidate in candidates}
+    
+    def get_related_words(self, word: str, depth: int = 2, cleaned: bool = True) -> FrozenSet[str]:
         """Get related words up to a certain depth.
         
+        Results are cached per (word, depth, cleaned), so repeated calls
+        return the same immutable set.
+        
         Args:
             word: The word to get related words for
             depth: How many levels of relations to explore (default: 2)
             cleaned: If True, returns cleaned versions (without synset format)
                    If False, returns raw versions (with synset format)
         """
+        cache_key = (word, depth, cleaned)
+        cached = self._cache_get(self._related_cache, cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             related = set()
-            synsets = wn.synsets(word)
+            synsets = self._synsets(word)
             
             for synset in synsets:
                 # Get immediate relations
@@ -318,8 +420,10 @@ class WordNet:
             if cleaned:
                 related = {word.split('.')[0] for word in related}
             
-            return related
+            result = frozenset(related)
+            self._cache_put(self._related_cache, cache_key, result, self.RELATED_CACHE_SIZE)
+            return result
             
         except Exception as e:
             logger.error(f"Error getting related words: {e}")
-            return set() 
\ No newline at end of file
+            return frozenset()
@@ -136,12 +136,38 @@ class TestWordNet:
         assert isinstance(similarity, float)
         assert similarity == 1.0  # Identical words should have maximum similarity
 
+    def test_get_word_similarities(self):
+        """Test that batch word similarity matches single-pair scores."""
+        wordnet = WordNet()
+        
+        candidates = ["puppy", "computer", "dog", "invalidword123"]
+        similarities = wordnet.get_word_similarities("dog", candidates)
+        assert isinstance(similarities, dict)
+        assert set(similarities) == set(candidates)
+        assert all(isinstance(s, float) for s in similarities.values())
+        assert similarities["dog"] == 1.0
+        assert similarities["invalidword123"] == 0.0
+        assert similarities["puppy"] > similarities["computer"]
+        # Score the single pairs on a fresh instance, so they are computed
+        # rather than read back from the batch call's cache
+        single = WordNet()
+        for candidate in candidates:
+            assert similarities[candidate] == single.get_word_similarity("dog", candidate)
+
+    def test_similarity_cache_is_bounded(self):
+        """Test that the similarity cache keeps only the most recently used pairs."""
+        wordnet = WordNet()
+        wordnet.SIMILARITY_CACHE_SIZE = 2
+        
+        wordnet.get_word_similarities("dog", ["cat", "puppy", "computer"])
+        assert list(wordnet._similarity_cache) == [("dog", "puppy"), ("computer", "dog")]
+
     def test_get_related_words(self):
         """Test that related word retrieval works correctly."""
         wordnet = WordNet()
         
         related = wordnet.get_related_words("dog")
-        assert isinstance(related, set)
+        assert isinstance(related, (set, frozenset))
         assert len(related) > 0
         assert all(isinstance(r, str) for r in related)
         
@@ -151,7 +177,7 @@ class TestWordNet:
         
         # Test with raw results
         raw_related = wordnet.get_related_words("dog", cleaned=False)
-        assert isinstance(raw_related, set)
+        assert isinstance(raw_related, (set, frozenset))
         assert len(raw_related) > 0
         assert all(isinstance(r, str) for r in raw_related)
         assert any('.' in word for word in raw_related)  # Should contain synset format
@@ -250,5 +276,5 @@ class TestWordNet:
 
         # Test invalid related words
         related = wordnet.get_related_words("invalidword123")
-        assert isinstance(related, set)
+        assert isinstance(related, (set, frozenset))
         assert len(related) == 0 
\ No newline at end of file
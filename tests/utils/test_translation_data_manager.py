@@ -0,0 +1,137 @@
+"""Tests for the structured translation store."""
+
+import pytest
+
+from utils import translation_data_manager
+from utils.translation_data_manager import TranslationDataManager
+
+
+def make_translation(source_text, source_language="en", target_language="de"):
+    return {
+        'source_text': source_text,
+        'translated_text': f"{source_text} (de)",
+        'notes': "",
+        'source_language': source_language,
+        'target_language': target_language,
+    }
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """A manager whose data and backup files live in a temporary directory."""
+    monkeypatch.setattr(translation_data_manager.appdirs, "user_cache_dir", lambda *args: str(tmp_path))
+    monkeypatch.setattr(translation_data_manager.config, "backup_dir", None, raising=False)
+    return TranslationDataManager()
+
+
+class TestTranslationDataManager:
+    """Test suite for TranslationDataManager."""
+
+    def test_saved_entries_are_not_shared_with_the_caller(self, manager):
+        """Test that editing a saved dict in place does not change the stored data."""
+        translations = [make_translation(f"word {i}") for i in range(3)]
+        assert manager.save_language_pair(translations, "en", "de")
+
+        translations[0]['source_text'] = "edited"
+        translations.append(make_translation("unsaved"))
+
+        stored = manager.get_language_pair("en", "de")
+        assert [t['source_text'] for t in stored] == ["word 0", "word 1", "word 2"]
+        assert manager.get_translation_stats()["by_pair"] == {"en-de": 3}
+
+    def test_added_entry_is_not_shared_with_the_caller(self, manager):
+        """Test that editing a dict after add_translation does not change the stored data."""
+        translation = make_translation("word")
+        assert manager.add_translation(translation)
+
+        translation['source_text'] = "edited"
+
+        assert [t['source_text'] for t in manager.get_language_pair("en", "de")] == ["word"]
+
+    def test_uncopied_entries_are_kept_as_given(self, manager):
+        """Test that copy=False stores the caller's snapshot instead of copying it again."""
+        first, second = make_translation("word 0"), make_translation("word 1")
+        assert manager.save_language_pair([first, second], "en", "de", copy=False)
+        translation = make_translation("added")
+        assert manager.add_translation(translation, index=0, copy=False)
+
+        stored = manager._load_structured_data()["en-de"]
+        assert stored == [translation, first, second]
+        assert all(s is t for s, t in zip(stored, [translation, first, second]))
+
+    def test_returned_entries_are_not_shared_with_the_cache(self, manager):
+        """Test that editing entries returned by get_language_pair does not change the stored data."""
+        assert manager.save_language_pair([make_translation("word")], "en", "de")
+
+        manager.get_language_pair("en", "de")[0]['source_text'] = "edited"
+
+        assert [t['source_text'] for t in manager.get_language_pair("en", "de")] == ["word"]
+
+    def test_add_translations_writes_once(self, manager, monkeypatch):
+        """Test that a bulk add across several pairs writes the store once."""
+        writes = []
+        write_json = translation_data_manager._write_json
+        monkeypatch.setattr(translation_data_manager, "_write_json",
+                            lambda path, data: (writes.append(path), write_json(path, data)))
+
+        translations = [make_translation(f"de {i}") for i in range(3)]
+        translations += [make_translation(f"fr {i}", target_language="fr") for i in range(2)]
+        translations.append({'source_text': "no languages"})
+
+        assert manager.add_translations(translations)
+        assert len(writes) == 1
+        assert manager.get_translation_stats() == {"total": 5, "by_pair": {"en-de": 3, "en-fr": 2}}
+
+    def test_add_translations_appends_in_order(self, manager):
+        """Test that bulk-added entries follow existing ones, keeping their input order per pair."""
+        assert manager.save_language_pair([make_translation("a"), make_translation("b")], "en", "de")
+
+        assert manager.add_translations([
+            make_translation("c"),
+            make_translation("x", target_language="fr"),
+            make_translation("d"),
+            make_translation("y", target_language="fr"),
+        ])
+
+        assert [t['source_text'] for t in manager.get_language_pair("en", "de")] == ["a", "b", "c", "d"]
+        assert [t['source_text'] for t in manager.get_language_pair("en", "fr")] == ["x", "y"]
+
+    def test_save_language_pairs_refuses_data_loss(self, manager, monkeypatch):
+        """Test that no pair is saved if any pair would lose significant data, unless forced."""
+        assert manager.save_language_pair([make_translation(f"de {i}") for i in range(10)], "en", "de")
+        assert manager.save_language_pair([make_translation("fr", target_language="fr")], "en", "fr")
+
+        writes = []
+        write_json = translation_data_manager._write_json
+        monkeypatch.setattr(translation_data_manager, "_write_json",
+                            lambda path, data: (writes.append(path), write_json(path, data)))
+
+        translations_by_pair = {
+            "en-fr": [make_translation(f"fr {i}", target_language="fr") for i in range(3)],
+            "en-de": [make_translation("de 0")],
+        }
+        assert not manager.save_language_pairs(translations_by_pair)
+        assert writes == []
+        assert manager.get_translation_stats()["by_pair"] == {"en-de": 10, "en-fr": 1}
+
+        assert manager.save_language_pairs(translations_by_pair, force=True)
+        assert len(writes) == 1
+        assert manager.get_translation_stats()["by_pair"] == {"en-de": 1, "en-fr": 3}
+
+    @pytest.mark.parametrize("value", ["2024-01-01T10:00:00", "2024-01-01 10:00+01", "2024-01-01T10:00+01"])
+    def test_non_canonical_dates_are_repaired(self, value):
+        """Test that ISO forms outside DATE_ADDED_FORMAT are not parsed, so no aware datetimes are returned."""
+        parsed, repaired = TranslationDataManager.parse_or_stamp_date_added(value)
+        assert repaired
+        assert parsed.tzinfo is None
+
+    @pytest.mark.parametrize("value, expected", [
+        ("2024-01-01 10:00:00", (2024, 1, 1, 10, 0, 0)),
+        ("2024-1-1 1:2:3", (2024, 1, 1, 1, 2, 3)),
+    ])
+    def test_date_added_format_is_parsed(self, value, expected):
+        """Test that values matching DATE_ADDED_FORMAT parse as naive datetimes without repair."""
+        parsed, repaired = TranslationDataManager.parse_or_stamp_date_added(value)
+        assert not repaired
+        assert parsed.tzinfo is None
+        assert parsed.timetuple()[:6] == expected
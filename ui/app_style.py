@@ -1,3 +1,5 @@
+from string import Template
+
 from PySide6.QtGui import QColor, QPalette
 from PySide6.QtCore import Qt
 from utils.config import config
@@ -32,98 +34,124 @@ class AppStyle:
         WARNING = "#ffb900"
         ERROR = "#d13438"
     
-    @classmethod
-    def get_theme_colors(cls):
-        """Get the current theme's color palette"""
-        if cls.IS_DARK_THEME:
-            return {
-                'bg': cls.Colors.DARK_BG,
-                'fg': cls.Colors.DARK_FG,
-                'accent': cls.Colors.DARK_ACCENT,
-                'highlight': cls.Colors.DARK_HIGHLIGHT,
-                'text': cls.Colors.DARK_TEXT,
-                'disabled': cls.Colors.DARK_DISABLED
-            }
-        else:
-            return {
-                'bg': cls.Colors.LIGHT_BG,
-                'fg': cls.Colors.LIGHT_FG,
-                'accent': cls.Colors.LIGHT_ACCENT,
-                'highlight': cls.Colors.LIGHT_HIGHLIGHT,
-                'text': cls.Colors.LIGHT_TEXT,
-                'disabled': cls.Colors.LIGHT_DISABLED
+    # Global QSS, substituted with the theme colors once per theme
+    _STYLESHEET_TEMPLATE = Template("""
+            QWidget {
+                background-color: ${bg};
+                color: ${text};
             }
-    
-    @classmethod
-    def get_global_stylesheet(cls):
-        """Get the global QSS stylesheet for the application"""
-        colors = cls.get_theme_colors()
-        
-        return f"""
-            QWidget {{
-                background-color: {colors['bg']};
-                color: {colors['text']};
-            }}
             
-            QPushButton {{
-                background-color: {colors['accent']};
-                color: {colors['text']};
-                border: 1px solid {colors['highlight']};
+            QPushButton {
+                background-color: ${accent};
+                color: ${text};
+                border: 1px solid ${highlight};
                 padding: 5px 10px;
                 border-radius: 4px;
-            }}
+            }
             
-            QPushButton:hover {{
-                background-color: {colors['highlight']};
-            }}
+            QPushButton:hover {
+                background-color: ${highlight};
+            }
             
-            QPushButton:pressed {{
-                background-color: {colors['accent']};
-            }}
+            QPushButton:pressed {
+                background-color: ${accent};
+            }
             
-            QPushButton:disabled {{
-                background-color: {colors['disabled']};
-                color: {colors['text']};
-            }}
+            QPushButton:disabled {
+                background-color: ${disabled};
+                color: ${text};
+            }
             
-            QLineEdit, QTextEdit {{
-                background-color: {colors['accent']};
-                color: {colors['text']};
-                border: 1px solid {colors['highlight']};
+            QLineEdit, QTextEdit {
+                background-color: ${accent};
+                color: ${text};
+                border: 1px solid ${highlight};
                 padding: 5px;
                 border-radius: 4px;
-            }}
+            }
             
-            QLabel {{
-                color: {colors['text']};
-            }}
+            QLabel {
+                color: ${text};
+            }
             
-            QScrollBar:vertical {{
-                background-color: {colors['accent']};
+            QScrollBar:vertical {
+                background-color: ${accent};
                 width: 12px;
                 margin: 0px;
-            }}
+            }
             
-            QScrollBar::handle:vertical {{
-                background-color: {colors['highlight']};
+            QScrollBar::handle:vertical {
+                background-color: ${highlight};
                 min-height: 20px;
                 border-radius: 6px;
-            }}
+            }
             
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
                 height: 0px;
-            }}
+            }
             
-            QProgressBar {{
-                border: 1px solid {colors['highlight']};
+            QProgressBar {
+                border: 1px solid ${highlight};
                 border-radius: 4px;
                 text-align: center;
-            }}
+            }
             
-            QProgressBar::chunk {{
-                background-color: {cls.Colors.PRIMARY};
-            }}
+            QProgressBar::chunk {
+                background-color: ${primary};
+            }
+        """)
+    _stylesheet_cache = {}
+    _palette_cache = {}
+    _widget_stylesheet_cache = {}
+    
+    # Theme color palettes, built once from the color definitions above
+    _DARK_COLORS = {
+        'bg': Colors.DARK_BG,
+        'fg': Colors.DARK_FG,
+        'accent': Colors.DARK_ACCENT,
+        'highlight': Colors.DARK_HIGHLIGHT,
+        'text': Colors.DARK_TEXT,
+        'disabled': Colors.DARK_DISABLED
+    }
+    _LIGHT_COLORS = {
+        'bg': Colors.LIGHT_BG,
+        'fg': Colors.LIGHT_FG,
+        'accent': Colors.LIGHT_ACCENT,
+        'highlight': Colors.LIGHT_HIGHLIGHT,
+        'text': Colors.LIGHT_TEXT,
+        'disabled': Colors.LIGHT_DISABLED
+    }
+    
+    @classmethod
+    def get_theme_colors(cls):
+        """Get the current theme's color palette"""
+        return cls._DARK_COLORS if cls.IS_DARK_THEME else cls._LIGHT_COLORS
+    
+    @classmethod
+    def get_global_stylesheet(cls):
+        """Get the global QSS stylesheet for the application"""
+        stylesheet = cls._stylesheet_cache.get(cls.IS_DARK_THEME)
+        if stylesheet is None:
+            stylesheet = cls._STYLESHEET_TEMPLATE.substitute(
+                cls.get_theme_colors(), primary=cls.Colors.PRIMARY)
+            cls._stylesheet_cache[cls.IS_DARK_THEME] = stylesheet
+        return stylesheet
+    
+    @classmethod
+    def get_widget_stylesheet(cls, selector, background, foreground, extra=""):
+        """Get a cached QSS rule setting a widget type's colors.
+        
+        Colors are set through QSS rather than palette roles because the
+        global stylesheet styles these widgets, and QSS takes precedence
+        over the palette.
         """
+        key = (selector, background, foreground, extra)
+        stylesheet = cls._widget_stylesheet_cache.get(key)
+        if stylesheet is None:
+            stylesheet = (f"{selector} {{ background-color: {background}; "
+                          f"color: {foreground}; {extra} }}")
+            cls._widget_stylesheet_cache[key] = stylesheet
+        return stylesheet
     
     @classmethod
     def apply_theme_to_palette(cls, palette: QPalette):
@@ -141,4 +169,13 @@ class AppStyle:
         palette.setColor(QPalette.Highlight, QColor(cls.Colors.PRIMARY))
         palette.setColor(QPalette.HighlightedText, QColor(colors['text']))
         
-        return palette
\ No newline at end of file
+        return palette
+    
+    @classmethod
+    def get_palette(cls):
+        """Get a copy of the shared QPalette for the current theme"""
+        palette = cls._palette_cache.get(cls.IS_DARK_THEME)
+        if palette is None:
+            palette = cls.apply_theme_to_palette(QPalette())
+            cls._palette_cache[cls.IS_DARK_THEME] = palette
+        return QPalette(palette)
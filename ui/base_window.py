@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QLineEdit, QComboBox, QSlider
@@ -15,9 +17,20 @@ class BaseWindow(SmartWindow):
     # Signal emitted when window is closed
     window_closed = Signal()
     
+    # Font shared by all labels and entries, created once a QApplication exists
+    _default_font = None
+    
+    @classmethod
+    def get_default_font(cls):
+        """Get the shared default font for window widgets."""
+        if cls._default_font is None:
+            BaseWindow._default_font = QFont("Arial", 10)
+        return cls._default_font
+    
     def __init__(self, parent=None, **kwargs):
         super().__init__(persistent_parent=parent, **kwargs)
         self.has_closed = False
+        self._styled = False
         self.row_counter0 = 0
         self.row_counter1 = 0
         
@@ -38,57 +51,61 @@ class BaseWindow(SmartWindow):
         self.setWindowTitle("Spracherwerb")
         self.setMinimumSize(800, 600)
         
-        # Apply application styling
-        self.setStyleSheet(AppStyle.get_global_stylesheet())
-        self.setPalette(AppStyle.apply_theme_to_palette(self.palette()))
-        
         # Connect close event
         self.closeEvent = self.on_closing
     
+    def showEvent(self, event):
+        """Apply the application palette the first time the window is shown.
+
+        The global stylesheet is set once on the QApplication and cascades to
+        every window, so it is not re-applied here.
+        """
+        if not self._styled:
+            self.setPalette(AppStyle.get_palette())
+            self._styled = True
+        super().showEvent(event)
+    
     def on_closing(self, event):
         """Handle window closing event."""
         self.has_closed = True
         self.window_closed.emit()
         event.accept()
     
-    def apply_to_grid(self, widget, row=-1, column=0, increment_row_counter=True, 
-                     alignment=None, padding=0, column_span=1):
-        """Add a widget to the appropriate layout with specified parameters."""
-        layout = self.sidebar_layout if column == 0 else self.content_layout
-        
-        if row == -1:
-            row = self.row_counter0 if column == 0 else self.row_counter1
-        
-        # Set alignment if specified
-        if alignment:
-            layout.setAlignment(widget, alignment)
-        
-        # Add widget to layout
-        layout.addWidget(widget)
-        
-        # Add spacing if specified
-        if padding > 0:
-            layout.addSpacing(padding)
-        
-        if increment_row_counter:
-            if column == 0:
+    @contextmanager
+    def batch_layout(self):
+        """Suspend repaints while adding many widgets, relaying out once."""
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def apply_to_grid(self, widget, column=0, increment_row_counter=True, padding=0):
+        """Add a widget to the sidebar (column 0) or content layout."""
+        if column == 0:
+            self.sidebar_layout.addWidget(widget)
+            if padding > 0:
+                self.sidebar_layout.addSpacing(padding)
+            if increment_row_counter:
                 self.row_counter0 += 1
-            else:
+        else:
+            self.content_layout.addWidget(widget)
+            if padding > 0:
+                self.content_layout.addSpacing(padding)
+            if increment_row_counter:
                 self.row_counter1 += 1
     
     def add_label(self, text, column=0, alignment=Qt.AlignLeft, padding=0, 
-                 row=-1, column_span=1, increment_row_counter=True):
+                 increment_row_counter=True):
         """Create and add a label to the window."""
         label = QLabel(text)
-        label.setFont(QFont("Arial", 10))
+        label.setFont(self.get_default_font())
+        label.setAlignment(alignment)
         self.apply_to_grid(
             label, 
-            row=row, 
             column=column, 
             increment_row_counter=increment_row_counter,
-            alignment=alignment,
-            padding=padding,
-            column_span=column_span
+            padding=padding
         )
         return label
     
@@ -108,7 +125,7 @@ class BaseWindow(SmartWindow):
         entry = QLineEdit()
         entry.setPlaceholderText(placeholder)
         entry.setFixedWidth(width)
-        entry.setFont(QFont("Arial", 10))
+        entry.setFont(self.get_default_font())
         
         # Apply any additional properties
         for key, value in kwargs.items():
@@ -145,24 +162,22 @@ class BaseWindow(SmartWindow):
     
     def remove_widget(self, widget):
         """Remove a widget from its layout."""
-        if widget.parent() == self.sidebar:
+        if widget.parent() is self.sidebar:
             self.sidebar_layout.removeWidget(widget)
-        else:
-            self.content_layout.removeWidget(widget)
-        widget.deleteLater()
-        
-        # Update row counters
-        if widget.parent() == self.sidebar:
             self.row_counter0 -= 1
         else:
+            self.content_layout.removeWidget(widget)
             self.row_counter1 -= 1
+        widget.deleteLater()
     
     def clear_layout(self, layout):
         """Clear all widgets from a layout."""
-        while layout.count():
-            item = layout.takeAt(0)
+        # Take items from the end so the layout never shifts its item list
+        for index in range(layout.count() - 1, -1, -1):
+            item = layout.takeAt(index)
             widget = item.widget()
             if widget:
+                widget.setParent(None)
                 widget.deleteLater()
     
     def clear_sidebar(self):
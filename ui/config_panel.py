@@ -3,10 +3,22 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QComboBox,
                              QListWidget, QLabel)
 from PySide6.QtCore import Qt, Signal
 
-from ui.gutenberg_search_window import GutenbergSearchWindow
+from extensions.gutenberg import Gutenberg
+from ui.gutenberg_search_window import GutenbergSearchWindow, populate_book_list
 from utils.config import config
 from utils.translations import I18N
-from utils.globals import Language
+from utils.globals import Language, ProficiencyLevel
+
+
+def _add_language_items(combo, include_latin=True):
+    """Fill a combo box with language names, storing codes as item data.
+
+    Names come from Language.get_language_name, which caches them per UI
+    locale, so they match the locale active when the combo box is filled.
+    """
+    for lang in Language:
+        if include_latin or lang != Language.LATIN:
+            combo.addItem(Language.get_language_name(lang.value), lang.value)
 
 
 class ConfigPanel(QWidget):
@@ -19,6 +31,22 @@ class ConfigPanel(QWidget):
         self.setMinimumWidth(250)
         self.app_actions = app_actions
         
+        # Build all widgets before the first layout pass
+        self.setUpdatesEnabled(False)
+        try:
+            self._init_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        # Store selected books
+        self.selected_books = []
+        
+        # Gutenberg client and search window, created on first use
+        self._gutenberg = None
+        self._search_window = None
+    
+    def _init_ui(self):
+        """Create the panel's widgets and layout."""
         # Create layout
         layout = QVBoxLayout(self)
         self.setLayout(layout)
@@ -29,26 +57,25 @@ class ConfigPanel(QWidget):
         
         # Source language
         self.source_language_combo = QComboBox()
-        # Use Language enum, but exclude Latin from source languages (typically not used as source)
-        source_languages = [lang for lang in Language if lang != Language.LATIN]
-        for lang in source_languages:
-            self.source_language_combo.addItem(Language.get_language_name(lang.value), lang.value)
+        # Latin is excluded from source languages (typically not used as source)
+        _add_language_items(self.source_language_combo, include_latin=False)
         self.source_language_combo.setCurrentText(Language.get_language_name(config.source_language))
-        self.source_language_combo.currentTextChanged.connect(self.on_source_language_changed)
+        self.source_language_combo.currentIndexChanged.connect(self.on_source_language_changed, Qt.DirectConnection)
         
         # Target language (language being learned)
         self.target_language_combo = QComboBox()
-        # Use Language enum for all supported languages
-        for lang in Language:
-            self.target_language_combo.addItem(Language.get_language_name(lang.value), lang.value)
+        _add_language_items(self.target_language_combo)
         self.target_language_combo.setCurrentText(Language.get_language_name(config.target_language))
-        self.target_language_combo.currentTextChanged.connect(self.on_target_language_changed)
+        self.target_language_combo.currentIndexChanged.connect(self.on_target_language_changed, Qt.DirectConnection)
         
         # Proficiency level
         self.level_combo = QComboBox()
-        self.level_combo.addItems(["Beginner", "Intermediate", "Advanced"])
-        self.level_combo.setCurrentText(config.proficiency_level.capitalize())
-        self.level_combo.currentTextChanged.connect(self.on_proficiency_level_changed)
+        for level in ProficiencyLevel:
+            self.level_combo.addItem(level.get_display_name(), level.value)
+        # Match case-insensitively, as hand-edited configs may store e.g. "Beginner"
+        self.level_combo.setCurrentIndex(
+            max(self.level_combo.findData(str(config.proficiency_level).lower()), 0))
+        self.level_combo.currentIndexChanged.connect(self.on_proficiency_level_changed, Qt.DirectConnection)
         
         language_layout.addRow("Source Language:", self.source_language_combo)
         language_layout.addRow("Target Language:", self.target_language_combo)
@@ -77,7 +104,7 @@ class ConfigPanel(QWidget):
         
         # Button to open Gutenberg search
         self.search_button = QPushButton("Select Books from Gutenberg")
-        self.search_button.clicked.connect(self._open_gutenberg_search)
+        self.search_button.clicked.connect(self._open_gutenberg_search, Qt.DirectConnection)
         books_layout.addWidget(self.search_button)
         
         # Label for selected books
@@ -96,7 +123,7 @@ class ConfigPanel(QWidget):
         translations_layout = QVBoxLayout()
         
         self.translations_button = QPushButton("Open Translation Notes")
-        self.translations_button.clicked.connect(self._open_translations)
+        self.translations_button.clicked.connect(self._open_translations, Qt.DirectConnection)
         translations_layout.addWidget(self.translations_button)
         
         translations_group.setLayout(translations_layout)
@@ -107,15 +134,22 @@ class ConfigPanel(QWidget):
         layout.addWidget(books_group)
         layout.addWidget(translations_group)
         layout.addStretch()
-        
-        # Store selected books
-        self.selected_books = []
+    
+    def get_gutenberg(self):
+        """Get the Gutenberg client shared by this panel and its windows."""
+        if self._gutenberg is None:
+            self._gutenberg = Gutenberg()
+        return self._gutenberg
     
     def _open_gutenberg_search(self):
         """Open the Gutenberg search window and handle book selection."""
-        search_window = GutenbergSearchWindow(self)
-        search_window.books_selected.connect(self._handle_selected_books)
-        search_window.show()
+        # Closing the window only hides it, so it is kept and reused
+        if self._search_window is None:
+            self._search_window = GutenbergSearchWindow(self, gutenberg=self.get_gutenberg())
+            self._search_window.books_selected.connect(self._handle_selected_books, Qt.DirectConnection)
+        self._search_window.show()
+        self._search_window.raise_()
+        self._search_window.activateWindow()
     
     def _handle_selected_books(self, books):
         """Handle the selection of books from the Gutenberg search window."""
@@ -125,30 +159,26 @@ class ConfigPanel(QWidget):
     def _update_books_list(self):
         """Update the list widget with the currently selected books."""
         self.books_list.clear()
-        for book in self.selected_books:
-            item_text = f"{book.title} - {', '.join(book.authors)}"
-            if book.word_count:
-                item_text += f" ({book.word_count} words)"
-            self.books_list.addItem(item_text)
+        populate_book_list(self.books_list, self.selected_books)
     
     def _open_translations(self):
         """Open the translations window using the app actions callback."""
         if self.app_actions and self.app_actions.open_translations:
             self.app_actions.open_translations()
     
-    def on_source_language_changed(self, language):
+    def on_source_language_changed(self, index):
         """Handle source language change."""
-        config.source_language = Language.get_language_code(language)
+        config.source_language = self.source_language_combo.itemData(index)
         self.languages_changed.emit()
     
-    def on_target_language_changed(self, language):
+    def on_target_language_changed(self, index):
         """Handle target language change."""
-        config.target_language = Language.get_language_code(language)
+        config.target_language = self.target_language_combo.itemData(index)
         self.languages_changed.emit()
     
-    def on_proficiency_level_changed(self, level):
+    def on_proficiency_level_changed(self, index):
         """Handle proficiency level change."""
-        config.proficiency_level = level.lower()
+        config.proficiency_level = self.level_combo.itemData(index)
     
     def get_selected_books(self):
         """Get the list of selected Gutenberg books."""
@@ -1,49 +1,94 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QLineEdit, QComboBox, QListWidget, QLabel, QMessageBox
+    QLineEdit, QComboBox, QListWidget, QListWidgetItem, QLabel, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal, Slot
 
 from ui.base_window import BaseWindow
 from extensions.gutenberg import Gutenberg, GutenbergBook
 from utils.config import config
 
 
+def populate_book_list(list_widget, books):
+    """Append books to a list widget as a single batched update."""
+    list_widget.setUpdatesEnabled(False)
+    list_widget.blockSignals(True)
+    try:
+        for book in books:
+            item = QListWidgetItem(book.display_text)
+            item.setData(Qt.UserRole, book)
+            list_widget.addItem(item)
+    finally:
+        list_widget.blockSignals(False)
+        list_widget.setUpdatesEnabled(True)
+
+
+class _SearchSignals(QObject):
+    """Carries search results from the worker thread back to the GUI thread."""
+    finished = Signal(int, list)  # Search sequence number, list of GutenbergBook
+
+
+class _SearchRunnable(QRunnable):
+    """Runs a Gutenberg book search on the global thread pool.
+
+    The runnable owns its unparented signal carrier, so closing the window
+    while a search is still running can't delete the carrier underneath it.
+    """
+    
+    def __init__(self, gutenberg, search_seq, language, search_term):
+        super().__init__()
+        self.gutenberg = gutenberg
+        self.search_seq = search_seq
+        self.language = language
+        self.search_term = search_term
+        self.signals = _SearchSignals()
+    
+    def run(self):
+        results = self.gutenberg.search_books(
+            language=self.language,
+            search_term=self.search_term
+        )
+        self.signals.finished.emit(self.search_seq, results)
+
+
 class GutenbergSearchWindow(BaseWindow):
     """Window for searching and selecting books from Project Gutenberg."""
     
     # Signal emitted when books are selected
     books_selected = Signal(list)  # List of GutenbergBook objects
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, gutenberg=None):
         super().__init__(parent)
         self.setWindowTitle("Gutenberg Book Search")
-        self.gutenberg = Gutenberg()
+        self.gutenberg = gutenberg if gutenberg is not None else Gutenberg()
         self.selected_books = []
+        self._selected_ids = set()
+        
+        # Searches run off the GUI thread; only the latest one is displayed
+        self._search_seq = 0
         
         # Initialize UI
-        self._init_search_controls()
-        self._init_results_list()
-        self._init_selection_list()
-        self._init_buttons()
+        with self.batch_layout():
+            self._init_search_controls()
+            self._init_results_list()
+            self._init_selection_list()
+            self._init_buttons()
         
         # Connect signals
         self._connect_signals()
     
     def _connect_signals(self):
-        """Connect all signals to their respective slots."""
+        """Connect all signals to their respective slots.
+        
+        All senders and receivers live on the GUI thread, so direct
+        connections are used. Buttons are already connected by add_button.
+        """
         # Connect search input
-        self.search_input.returnPressed.connect(self._perform_search)
+        self.search_input.returnPressed.connect(self._perform_search, Qt.DirectConnection)
         
         # Connect list widget interactions
-        self.results_list.itemDoubleClicked.connect(self._add_selected_book)
-        self.selection_list.itemDoubleClicked.connect(self._remove_selected_book)
-        
-        # Connect buttons
-        self.search_button.clicked.connect(self._perform_search)
-        self.add_button.clicked.connect(self._add_selected_book)
-        self.remove_button.clicked.connect(self._remove_selected_book)
-        self.save_button.clicked.connect(self._save_selection)
+        self.results_list.itemDoubleClicked.connect(self._add_selected_book, Qt.DirectConnection)
+        self.selection_list.itemDoubleClicked.connect(self._remove_selected_book, Qt.DirectConnection)
     
     def _init_search_controls(self):
         """Initialize the search controls section."""
@@ -126,47 +171,56 @@ class GutenbergSearchWindow(BaseWindow):
         # Clear previous results
         self.results_list.clear()
         
-        # Perform search
-        results = self.gutenberg.search_books(
-            language=language,
-            search_term=search_term
-        )
-        
-        # Display results
-        for book in results:
-            item_text = f"{book.title} - {', '.join(book.authors)}"
-            if book.word_count:
-                item_text += f" ({book.word_count} words)"
-            self.results_list.addItem(item_text)
-            self.results_list.item(self.results_list.count() - 1).setData(
-                Qt.UserRole, book
-            )
+        # Perform search in the background
+        self._search_seq += 1
+        self.search_button.setEnabled(False)
+        runnable = _SearchRunnable(self.gutenberg, self._search_seq, language, search_term)
+        runnable.signals.finished.connect(self._on_search_results)
+        QThreadPool.globalInstance().start(runnable)
+    
+    @Slot(int, list)
+    def _on_search_results(self, search_seq, results):
+        """Display search results unless a newer search has started."""
+        if search_seq != self._search_seq:
+            return
+        self.search_button.setEnabled(True)
+        populate_book_list(self.results_list, results)
     
     @Slot()
     def _add_selected_book(self):
         """Add the selected book(s) to the selection list."""
         selected_items = self.results_list.selectedItems()
+        new_books = []
         for item in selected_items:
             book = item.data(Qt.UserRole)
-            if book not in self.selected_books:
+            if book.id not in self._selected_ids:
+                self._selected_ids.add(book.id)
                 self.selected_books.append(book)
-                item_text = f"{book.title} - {', '.join(book.authors)}"
-                if book.word_count:
-                    item_text += f" ({book.word_count} words)"
-                self.selection_list.addItem(item_text)
-                self.selection_list.item(self.selection_list.count() - 1).setData(
-                    Qt.UserRole, book
-                )
+                new_books.append(book)
+        populate_book_list(self.selection_list, new_books)
     
     @Slot()
     def _remove_selected_book(self):
         """Remove the selected book(s) from the selection list."""
         selected_items = self.selection_list.selectedItems()
+        if not selected_items:
+            return
+        
+        removed_ids = set()
+        rows = []
         for item in selected_items:
             book = item.data(Qt.UserRole)
-            if book in self.selected_books:
-                self.selected_books.remove(book)
-                self.selection_list.takeItem(self.selection_list.row(item))
+            if book.id in self._selected_ids:
+                removed_ids.add(book.id)
+                rows.append(self.selection_list.row(item))
+        
+        # Take rows from the bottom up so earlier rows keep their index
+        for row in sorted(rows, reverse=True):
+            self.selection_list.takeItem(row)
+        self._selected_ids -= removed_ids
+        self.selected_books = [
+            book for book in self.selected_books if book.id not in removed_ids
+        ]
     
     @Slot()
     def _save_selection(self):
@@ -1,10 +1,26 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QLineEdit, QPushButton, QFrame
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, QBuffer, QByteArray, QIODevice, QTimer
+from PySide6.QtGui import QFont, QPixmap, QTextCharFormat, QTextCursor
+from ui.app_style import AppStyle
 from utils.config import config
 
+# Widget stylesheets are identical for every panel, so build them once
+_LOG_QSS = AppStyle.get_widget_stylesheet(
+    "QTextEdit", config.background_color, config.foreground_color,
+    "border: 1px solid #3a3a3a;")
+_INPUT_QSS = AppStyle.get_widget_stylesheet(
+    "QLineEdit", config.background_color, config.foreground_color,
+    "border: 1px solid #3a3a3a; padding: 5px;")
+_BUTTON_QSS = AppStyle.get_widget_stylesheet(
+    "QPushButton", "#2a2a2a", config.foreground_color,
+    "border: 1px solid #3a3a3a; padding: 5px;"
+) + " QPushButton:hover { background-color: #3a3a3a; }"
+
 class InteractionPanel(QWidget):
     """Right sidebar for user interaction with the language agent"""
+    # Oldest log blocks are dropped beyond this count
+    MAX_LOG_BLOCKS = 2000
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumWidth(300)
@@ -17,15 +33,16 @@ class InteractionPanel(QWidget):
         self.log_area = QTextEdit()
         self.log_area.setReadOnly(True)
         self.log_area.setAcceptRichText(True)  # Enable HTML content
-        self.log_area.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {config.background_color};
-                color: {config.foreground_color};
-                border: 1px solid #3a3a3a;
-            }}
-        """)
+        self.log_area.setStyleSheet(_LOG_QSS)
+        self.log_area.document().setMaximumBlockCount(self.MAX_LOG_BLOCKS)
         layout.addWidget(self.log_area)
         
+        # Plain messages are inserted directly rather than parsed as HTML
+        self._cursor = QTextCursor(self.log_area.document())
+        self._sender_format = QTextCharFormat()
+        self._sender_format.setFontWeight(QFont.Bold)
+        self._text_format = QTextCharFormat()
+        
         # User input area
         input_frame = QFrame()
         input_layout = QVBoxLayout(input_frame)
@@ -33,54 +50,53 @@ class InteractionPanel(QWidget):
         self.input_field = QLineEdit()
         self.input_field.setPlaceholderText("Type your message here...")
         self.input_field.returnPressed.connect(self.send_message)
-        self.input_field.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {config.background_color};
-                color: {config.foreground_color};
-                border: 1px solid #3a3a3a;
-                padding: 5px;
-            }}
-        """)
+        self.input_field.setStyleSheet(_INPUT_QSS)
         
         self.send_button = QPushButton("Send")
         self.send_button.clicked.connect(self.send_message)
-        self.send_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #2a2a2a;
-                color: {config.foreground_color};
-                border: 1px solid #3a3a3a;
-                padding: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: #3a3a3a;
-            }}
-        """)
+        self.send_button.setStyleSheet(_BUTTON_QSS)
         
         input_layout.addWidget(self.input_field)
         input_layout.addWidget(self.send_button)
         layout.addWidget(input_frame)
         
+        # Scrolling is coalesced to once per event loop pass
+        self._scroll_pending = False
+        
     def append_message(self, sender, content, is_html=False):
         """Append a message to the log area with optional HTML content"""
         if is_html:
             self.log_area.append(f"<b>{sender}:</b><br>{content}")
         else:
-            self.log_area.append(f"<b>{sender}:</b><br>{content}")
-        self.log_area.verticalScrollBar().setValue(
-            self.log_area.verticalScrollBar().maximum()
-        )
+            cursor = self._cursor
+            cursor.movePosition(QTextCursor.End)
+            if not self.log_area.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(f"{sender}:", self._sender_format)
+            # Line separator keeps the message in one block, like <br>
+            cursor.insertText(f"\u2028{content}", self._text_format)
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            QTimer.singleShot(0, self._scroll_to_bottom)
+    
+    def _scroll_to_bottom(self):
+        """Scroll the log area to the latest message"""
+        self._scroll_pending = False
+        scroll_bar = self.log_area.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
         
     def append_media_message(self, sender, media_path, media_type="image", caption=None):
         """Append a message containing media to the log area"""
         if media_type == "image":
             pixmap = QPixmap(media_path)
             if not pixmap.isNull():
-                # Convert pixmap to base64 for HTML display
-                import base64
-                from io import BytesIO
-                buffer = BytesIO()
+                # Convert pixmap to base64 for HTML display, encoding in Qt
+                image_data = QByteArray()
+                buffer = QBuffer(image_data)
+                buffer.open(QIODevice.WriteOnly)
                 pixmap.save(buffer, "PNG")
-                img_str = base64.b64encode(buffer.getvalue()).decode()
+                buffer.close()
+                img_str = bytes(image_data.toBase64()).decode('ascii')
                 
                 # Create HTML content with image
                 html_content = f'<img src="data:image/png;base64,{img_str}" style="max-width: 100%;">'
@@ -1,9 +1,10 @@
 import os
 import platform
+from collections import OrderedDict
 from enum import Enum, auto
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtCore import Qt, QSize, QTimer, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QPixmap, QImage, QPixmapCache
 import vlc
 
 class MediaType(Enum):
@@ -12,8 +13,48 @@ class MediaType(Enum):
     IMAGE = auto()
     VIDEO = auto()
 
+class _ImageLoadSignals(QObject):
+    """Carries a decoded image from the worker thread back to the GUI thread."""
+    finished = Signal(int, QImage)  # Load sequence number, decoded image (null on failure)
+
+class _ImageLoadRunnable(QRunnable):
+    """Decodes an image file into a QImage on the global thread pool.
+
+    The runnable owns its unparented signal carrier, so destroying the frame
+    while a decode is still running can't delete the carrier underneath it.
+    """
+    
+    def __init__(self, image_path, load_seq):
+        super().__init__()
+        self.image_path = image_path
+        self.load_seq = load_seq
+        self.signals = _ImageLoadSignals()
+    
+    def run(self):
+        # QImage, unlike QPixmap, may be used off the GUI thread
+        image = QImage()
+        image.load(self.image_path)
+        self.signals.finished.emit(self.load_seq, image)
+
 class MediaFrame(QWidget):
     """Display area for generated images and videos"""
+    # Delay after the last resize before the image is rescaled smoothly
+    SMOOTH_SCALE_DELAY_MS = 80
+    # Size of the shared pixmap cache for recently shown images, in KB
+    PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+    # Videos shown here are locally generated files, so VLC's default input
+    # caching (around a second) only delays the first frame
+    VLC_ARGS = (
+        '--file-caching=50',
+        '--network-caching=100',
+        '--clock-jitter=0',
+        '--clock-synchro=0',
+        '--drop-late-frames',
+        '--skip-frames',
+    )
+    # Number of parsed vlc.Media objects kept for videos shown again
+    MEDIA_CACHE_SIZE = 8
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(400, 400)
@@ -29,10 +70,27 @@ class MediaFrame(QWidget):
         self.image_label.setStyleSheet("background-color: #1a1a1a;")
         layout.addWidget(self.image_label)
         
+        # Unscaled copy of the displayed image, so rescales never start from a scaled pixmap
+        self._source_pixmap = None
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(self.SMOOTH_SCALE_DELAY_MS)
+        self._smooth_timer.timeout.connect(self._rescale_smooth)
+        
+        # Recently shown images are kept in QPixmapCache under _cache_key
+        QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_LIMIT_KB)
+        self._cache_key = None
+        
+        # Images are decoded off the GUI thread; only the latest request is shown
+        self._load_seq = 0
+        
         # VLC player setup
-        self.vlc_instance = vlc.Instance()
+        self.vlc_instance = vlc.Instance(list(self.VLC_ARGS))
         self.vlc_media_player = self.vlc_instance.media_player_new()
         self.vlc_media = None
+        self._media_cache = OrderedDict()
+        # The render window is bound when the first video plays
+        self._video_output_bound = False
         self.current_media_type = MediaType.NONE
         
     def display_image(self, image_path):
@@ -45,11 +103,46 @@ class MediaFrame(QWidget):
         if self.current_media_type == MediaType.VIDEO:
             self.vlc_media_player.stop()
             
-        # Load and display image
-        pixmap = QPixmap(image_path)
-        scaled_pixmap = pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.image_label.setPixmap(scaled_pixmap)
+        self._load_seq += 1
         self.current_media_type = MediaType.IMAGE
+        # The modification time is part of the key so a regenerated file is not served stale
+        self._cache_key = f"{image_path}:{os.path.getmtime(image_path)}"
+        cached = QPixmapCache.find(self._cache_key)
+        if cached is not None and not cached.isNull():
+            self._source_pixmap = cached
+            self._rescale_smooth()
+            return
+        
+        # Decode in the background, the image is displayed in _on_image_loaded
+        self._source_pixmap = None
+        runnable = _ImageLoadRunnable(image_path, self._load_seq)
+        runnable.signals.finished.connect(self._on_image_loaded)
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_image_loaded(self, load_seq, image):
+        if load_seq != self._load_seq or self.current_media_type != MediaType.IMAGE:
+            return  # A newer image, a video or a clear has superseded this load
+        if image.isNull():
+            self.image_label.setText("Failed to load image")
+            return
+        self._source_pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self._cache_key, self._source_pixmap)
+        self._rescale_smooth()
+    
+    def _scaled_source(self, transformation):
+        return self._source_pixmap.scaled(self.size(), Qt.KeepAspectRatio, transformation)
+    
+    def _rescale_smooth(self):
+        if self.current_media_type != MediaType.IMAGE or self._source_pixmap is None:
+            return
+        # Smooth scales are cached too, so returning to a previous size is a lookup
+        size = self.size()
+        scaled_key = f"{self._cache_key}@{size.width()}x{size.height()}"
+        scaled = QPixmapCache.find(scaled_key)
+        if scaled is None or scaled.isNull():
+            scaled = self._scaled_source(Qt.SmoothTransformation)
+            QPixmapCache.insert(scaled_key, scaled)
+        self.image_label.setPixmap(scaled)
         
     def display_video(self, video_path):
         """Display a video in the media frame"""
@@ -59,16 +152,13 @@ class MediaFrame(QWidget):
             
         # Clear any displayed image
         self.image_label.clear()
+        self._load_seq += 1
+        self._source_pixmap = None
         
         # Set up VLC player
-        self.vlc_media = self.vlc_instance.media_new(video_path)
+        self.vlc_media = self._get_media(video_path)
         self.vlc_media_player.set_media(self.vlc_media)
-        
-        # Set the window ID where to render VLC's video output
-        if platform.system() == 'Windows':
-            self.vlc_media_player.set_hwnd(self.winId())
-        else:
-            self.vlc_media_player.set_xwindow(self.winId())
+        self._bind_video_output()
             
         # Start playback
         if self.vlc_media_player.play() == -1:
@@ -77,21 +167,49 @@ class MediaFrame(QWidget):
             
         self.current_media_type = MediaType.VIDEO
         
+    def _get_media(self, video_path):
+        """Return a vlc.Media for the path, reusing recently played ones."""
+        key = (video_path, os.path.getmtime(video_path))
+        media = self._media_cache.get(key)
+        if media is not None:
+            self._media_cache.move_to_end(key)
+            return media
+        media = self.vlc_instance.media_new(video_path)
+        self._media_cache[key] = media
+        if len(self._media_cache) > self.MEDIA_CACHE_SIZE:
+            self._media_cache.popitem(last=False)
+        return media
+        
+    def _bind_video_output(self):
+        """Set the window ID where VLC renders video output, once.
+
+        Called when a video first plays, since winId() turns the frame into a
+        native window, which is not needed while only images are shown.
+        """
+        if self._video_output_bound:
+            return
+        if platform.system() == 'Windows':
+            self.vlc_media_player.set_hwnd(int(self.winId()))
+        else:
+            self.vlc_media_player.set_xwindow(int(self.winId()))
+        self._video_output_bound = True
+        
     def clear(self):
         """Clear the media frame"""
         if self.current_media_type == MediaType.VIDEO:
             self.vlc_media_player.stop()
         self.image_label.clear()
+        self._load_seq += 1
+        self._source_pixmap = None
         self.current_media_type = MediaType.NONE
         
     def resizeEvent(self, event):
         """Handle window resize events"""
         super().resizeEvent(event)
-        if self.current_media_type == MediaType.IMAGE and self.image_label.pixmap():
-            # Rescale the image to fit the new size
-            pixmap = self.image_label.pixmap()
-            scaled_pixmap = pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.image_label.setPixmap(scaled_pixmap)
+        if self.current_media_type == MediaType.IMAGE and self._source_pixmap is not None:
+            # Fast rescale from the original while resizing, then a smooth pass once it settles
+            self.image_label.setPixmap(self._scaled_source(Qt.FastTransformation))
+            self._smooth_timer.start()
             
     def closeEvent(self, event):
         """Clean up resources when closing"""
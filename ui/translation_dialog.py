@@ -9,39 +9,33 @@ from utils.globals import Language
 from utils.translations import I18N
 
 class CustomTextEdit(QTextEdit):
+    # Resolved once; keyPressEvent runs for every keystroke in the dialog
+    _KEY_RETURN = Qt.Key_Return
+    _KEY_ESCAPE = Qt.Key_Escape
+    _KEY_TAB = Qt.Key_Tab
+    _KEY_BACKTAB = Qt.Key_Backtab  # Delivered for Shift+Tab
+    _CONTROL = Qt.ControlModifier
+    _SHIFT = Qt.ShiftModifier
+
     def find_next_input_widget(self, forward=True):
         """Find the next or previous input widget in the dialog, skipping internal widgets
         
         Args:
             forward (bool): If True, find next widget; if False, find previous widget
         """
-        current = self
-        dialog = self.window()  # Get the top-level dialog
-        
-        # Get all input widgets in order
-        input_widgets = [
-            dialog._source_text_edit,
-            dialog._translated_text_edit,
-            dialog._notes_edit,
-            dialog.add_button,
-            dialog.cancel_button
-        ]
-        
-        # Find current widget's index
-        try:
-            current_index = input_widgets.index(current)
-            if forward:
-                # Return next widget, wrapping around if needed
-                return input_widgets[(current_index + 1) % len(input_widgets)]
-            else:
-                # Return previous widget, wrapping around if needed
-                return input_widgets[(current_index - 1) % len(input_widgets)]
-        except ValueError:
+        ring = getattr(self.window(), '_nav_ring', None)
+        nav_index = getattr(self, '_nav_index', None)
+        if ring is None or nav_index is None:
             return None
+        # Wrap around at either end of the ring
+        return ring[(nav_index + (1 if forward else -1)) % len(ring)]
 
     def keyPressEvent(self, event: QKeyEvent):
+        key = event.key()
+        modifiers = event.modifiers()
+        
         # Handle Ctrl+Enter to accept
-        if event.key() == Qt.Key_Return and event.modifiers() & Qt.ControlModifier:
+        if key == self._KEY_RETURN and modifiers & self._CONTROL:
             dialog = self.window()
             if dialog.validate_inputs():
                 dialog.accept()
@@ -49,18 +43,17 @@ class CustomTextEdit(QTextEdit):
             return
             
         # Handle Shift+Escape to cancel
-        if event.key() == Qt.Key_Escape and event.modifiers() & Qt.ShiftModifier:
+        if key == self._KEY_ESCAPE and modifiers & self._SHIFT:
             dialog = self.window()
             dialog.reject()
             event.accept()
             return
             
         # Handle Tab navigation and insertion
-        is_shift_tab = event.key() == 16777218  # Shift+Tab key code
-        if event.key() == Qt.Key_Tab or is_shift_tab:
-            raw_modifiers = event.modifiers()
-            shift_pressed = is_shift_tab or bool(raw_modifiers & Qt.ShiftModifier)
-            ctrl_pressed = bool(raw_modifiers & Qt.ControlModifier)
+        is_shift_tab = key == self._KEY_BACKTAB
+        if key == self._KEY_TAB or is_shift_tab:
+            shift_pressed = is_shift_tab or bool(modifiers & self._SHIFT)
+            ctrl_pressed = bool(modifiers & self._CONTROL)
             
             if ctrl_pressed and not shift_pressed:
                 # If Ctrl is pressed without Shift, insert a tab character
@@ -125,6 +118,17 @@ class TranslationDialog(QDialog):
         button_layout.addWidget(self.add_button)
         layout.addLayout(button_layout)
         
+        # Focus ring used by CustomTextEdit for Tab/Shift+Tab, built once
+        self._nav_ring = (
+            self._source_text_edit,
+            self._translated_text_edit,
+            self._notes_edit,
+            self.add_button,
+            self.cancel_button
+        )
+        for i, widget in enumerate(self._nav_ring):
+            widget._nav_index = i
+        
         # Set tab order
         self.setTabOrder(self._source_text_edit, self._translated_text_edit)
         self.setTabOrder(self._translated_text_edit, self._notes_edit)
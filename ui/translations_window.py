@@ -1,9 +1,12 @@
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-                             QTableWidgetItem, QPushButton, QLineEdit, QLabel,
-                             QComboBox, QHeaderView, QMessageBox, QSizePolicy,
-                             QFileDialog)
-from PySide6.QtCore import Qt, QDateTime, Signal, QSize
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                             QPushButton, QLineEdit, QLabel, QApplication,
+                             QComboBox, QHeaderView, QMessageBox, QStyle,
+                             QStyledItemDelegate, QStyleOptionButton, QFileDialog)
+from PySide6.QtCore import (Qt, QDateTime, Signal, QSize, QTimer, QRect, QEvent,
+                            QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+                            QObject, QRunnable, QThreadPool)
 from PySide6.QtGui import QShortcut, QKeySequence
+from contextlib import contextmanager
 import csv
 import os
 from datetime import datetime
@@ -15,7 +18,259 @@ from utils.translations import I18N
 from utils.translation_data_manager import TranslationDataManager
 from ui.translation_dialog import TranslationDialog
 
+
+class TranslationsModel(QAbstractTableModel):
+    """Table model over the translation dicts shown in the translations window.
+
+    Columns 0 and 4 hold the Edit/Remove actions, which are painted by a
+    ButtonDelegate rather than backed by per-row widgets.
+    """
+
+    EDIT_COLUMN = 0
+    REMOVE_COLUMN = 4
+    HEADERS = ("", "Source Text", "Translated Text", "Notes", "")
+    FIELDS = (None, 'source_text', 'translated_text', 'notes', None)
+
+    # Precomputed per-row key columns, usable as sort keys
+    SEARCH_KEY = 0
+    DATE_KEY = 1
+    SOURCE_KEY = 2
+    TRANSLATED_KEY = 3
+
+    # Queries at least this long are narrowed through the n-gram index
+    NGRAM_SIZE = 3
+
+    def __init__(self, translations=None, parent=None):
+        super().__init__(parent)
+        self.translations = translations if translations is not None else []
+        self._build_key_columns()
+
+    @staticmethod
+    def _build_row_keys(translation):
+        """Search text, date added and lowercased texts, computed once per row change."""
+        source_lc = translation['source_text'].lower()
+        translated_lc = translation['translated_text'].lower()
+        return (
+            f"{source_lc}\n{translated_lc}\n{translation.get('notes', '').lower()}",
+            # Naive datetimes compare in C; timestamp() would add a local-time conversion per row
+            TranslationDataManager.parse_or_stamp_date_added(translation.get('date_added'))[0],
+            source_lc,
+            translated_lc,
+        )
+
+    def _build_key_columns(self):
+        # One list per key rather than one tuple per row, so a sort key is a
+        # single list index and a column can be reordered on its own
+        rows = [self._build_row_keys(t) for t in self.translations]
+        self._key_columns = [list(column) for column in zip(*rows)] if rows else [[], [], [], []]
+        self._invalidate_search_index()
+
+    def _invalidate_search_index(self):
+        # Row numbers shift on any change, so the index is rebuilt on next use
+        self._ngram_index = None
+        self._candidates = (None, None)
+
+    def _build_search_index(self):
+        n = self.NGRAM_SIZE
+        index = {}
+        for row, text in enumerate(self._key_columns[self.SEARCH_KEY]):
+            for ngram in {text[i:i + n] for i in range(len(text) - n + 1)}:
+                rows = index.get(ngram)
+                if rows is None:
+                    index[ngram] = {row}
+                else:
+                    rows.add(row)
+        self._ngram_index = index
+
+    def candidate_rows(self, search_text):
+        """Rows whose search text may contain the lowercased query.
+
+        Returns None when the query is too short to use the index, in which
+        case every row has to be checked.
+        """
+        n = self.NGRAM_SIZE
+        if len(search_text) < n:
+            return None
+        if self._candidates[0] == search_text:
+            return self._candidates[1]
+        if self._ngram_index is None:
+            self._build_search_index()
+        row_sets = []
+        for i in range(len(search_text) - n + 1):
+            rows = self._ngram_index.get(search_text[i:i + n])
+            if rows is None:
+                row_sets = [set()]
+                break
+            row_sets.append(rows)
+        row_sets.sort(key=len)
+        candidates = row_sets[0].intersection(*row_sets[1:])
+        self._candidates = (search_text, candidates)
+        return candidates
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.translations)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        field = self.FIELDS[index.column()]
+        if field is None:
+            return None
+        return self.translations[index.row()].get(field, '')
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def translation(self, row):
+        return self.translations[row]
+
+    def search_text(self, row):
+        """Lowercased source, translated and notes text for the given row."""
+        return self._key_columns[self.SEARCH_KEY][row]
+
+    def set_translations(self, translations):
+        """Replace all rows at once."""
+        self.beginResetModel()
+        self.translations = translations
+        self._build_key_columns()
+        self.endResetModel()
+
+    def sort_rows(self, key, reverse=False):
+        """Reorder rows by one of the precomputed keys (e.g. DATE_KEY)."""
+        order = sorted(range(len(self.translations)),
+                       key=self._key_columns[key].__getitem__, reverse=reverse)
+        self.beginResetModel()
+        # Reorder in place, the window shares this list
+        self.translations[:] = [self.translations[i] for i in order]
+        self._key_columns = [[column[i] for i in order] for column in self._key_columns]
+        self._invalidate_search_index()
+        self.endResetModel()
+
+    def insert_translation(self, row, translation):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.translations.insert(row, translation)
+        for column, key in zip(self._key_columns, self._build_row_keys(translation)):
+            column.insert(row, key)
+        self._invalidate_search_index()
+        self.endInsertRows()
+
+    def update_translation(self, row, changes):
+        translation = self.translations[row]
+        translation.update(changes)
+        for column, key in zip(self._key_columns, self._build_row_keys(translation)):
+            column[row] = key
+        self._invalidate_search_index()
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def remove_translation(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.translations[row]
+        for column in self._key_columns:
+            del column[row]
+        self._invalidate_search_index()
+        self.endRemoveRows()
+
+
+class TranslationsFilterProxyModel(QSortFilterProxyModel):
+    """Filters TranslationsModel rows against its precomputed search text."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search_text = ""
+
+    def set_search_text(self, text):
+        text = text.lower()
+        if text != self._search_text:
+            self._search_text = text
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        # An empty query accepts every row without touching the source model
+        if not self._search_text:
+            return True
+        model = self.sourceModel()
+        candidates = model.candidate_rows(self._search_text)
+        if candidates is not None and source_row not in candidates:
+            return False
+        return self._search_text in model.search_text(source_row)
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """Paints a push button in each cell of a column and reports clicks on it."""
+
+    clicked = Signal(QModelIndex)
+
+    BUTTON_HEIGHT = 20
+
+    def __init__(self, text, width, parent=None):
+        super().__init__(parent)
+        self._width = width
+        # One option is reused for every cell, only its rect changes per paint
+        self._button_option = QStyleOptionButton()
+        self._button_option.text = text
+        self._button_option.state = QStyle.State_Enabled
+
+    def _button_rect(self, rect):
+        return QRect(rect.x() + (rect.width() - self._width) // 2,
+                     rect.y() + (rect.height() - self.BUTTON_HEIGHT) // 2,
+                     self._width, self.BUTTON_HEIGHT)
+
+    def paint(self, painter, option, index):
+        button = self._button_option
+        button.rect = self._button_rect(option.rect)
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+    def column_width(self):
+        return self._width + 4
+
+    def sizeHint(self, option, index):
+        return QSize(self.column_width(), self.BUTTON_HEIGHT)
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and self._button_rect(option.rect).contains(event.position().toPoint())):
+            self.clicked.emit(index)
+            return True
+        return False
+
+
+class _SaveSignals(QObject):
+    """Carries the outcome of a background save back to the GUI thread."""
+    finished = Signal(object, bool, str)  # Save request, saved, error message
+
+
+class _SaveRunnable(QRunnable):
+    """Runs a TranslationDataManager save off the GUI thread.
+
+    The runnable owns its unparented signal carrier, so closing the window
+    while a save is still running can't delete the carrier underneath it.
+    """
+
+    def __init__(self, save, request):
+        super().__init__()
+        self.save = save
+        self.request = request
+        self.signals = _SaveSignals()
+
+    def run(self):
+        try:
+            saved, error = bool(self.save()), ""
+        except Exception as e:
+            saved, error = False, str(e)
+        self.signals.finished.emit(self.request, saved, error)
+
+
 class TranslationsWindow(SmartWindow):
+    # Delay before re-filtering after the last keystroke in the search box
+    FILTER_DEBOUNCE_MS = 150
+
     def __init__(self, parent=None, **kwargs):
         super().__init__(persistent_parent=parent, title="Translation Notes", geometry="800x600", **kwargs)
         self.setMinimumSize(800, 600)
@@ -23,17 +278,25 @@ class TranslationsWindow(SmartWindow):
         # Initialize data manager
         self.data_manager = TranslationDataManager()
         
-        # Initialize translations data
+        # Saves run one at a time off the GUI thread so they land in order
+        self._save_pool = QThreadPool()
+        self._save_pool.setMaxThreadCount(1)
+        # Latest save refused for data loss while the confirmation dialog is open
+        self._refused_save = None
+        
+        # Initialize translations data, loaded when the window is first shown
         self.translations = []
-        self.load_translations()
+        self._loaded = False
         
         # Main layout on self (SmartWindow is QWidget, no setCentralWidget)
         layout = QVBoxLayout(self)
         
         # Create language display
         language_layout = QHBoxLayout()
-        self.source_language_label = QLabel(f"Source: {Language.get_language_name(config.source_language)}")
-        self.target_language_label = QLabel(f"Target: {Language.get_language_name(config.target_language)}")
+        self.source_language_label = QLabel()
+        self.target_language_label = QLabel()
+        self._displayed_languages = None
+        self._update_language_labels()
         language_layout.addWidget(self.source_language_label)
         language_layout.addWidget(self.target_language_label)
         layout.addLayout(language_layout)
@@ -42,7 +305,12 @@ class TranslationsWindow(SmartWindow):
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search translations...")
-        self.search_input.textChanged.connect(self.filter_translations)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.filter_translations)
+        self.search_input.textChanged.connect(self._filter_timer.start)
+        self.search_input.returnPressed.connect(self._filter_now)
         search_layout.addWidget(self.search_input)
         
         # Create sort combo box
@@ -70,177 +338,214 @@ class TranslationsWindow(SmartWindow):
         layout.addLayout(search_layout)
         
         # Create table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)  # Removed date column
-        self.table.setHorizontalHeaderLabels(["", "Source Text", "Translated Text", "Notes", ""])
+        self.model = TranslationsModel(self.translations, self)
+        self.table = QTableView()
+        self.proxy = TranslationsFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.table.setModel(self.proxy)
+        
+        self.edit_delegate = ButtonDelegate("Edit", 50, self.table)
+        self.edit_delegate.clicked.connect(self._on_edit_clicked)
+        self.table.setItemDelegateForColumn(TranslationsModel.EDIT_COLUMN, self.edit_delegate)
+        self.remove_delegate = ButtonDelegate("Remove", 60, self.table)
+        self.remove_delegate.clicked.connect(self._on_remove_clicked)
+        self.table.setItemDelegateForColumn(TranslationsModel.REMOVE_COLUMN, self.remove_delegate)
         
-        # Set column resize modes
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)  # Edit button
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)  # Source text
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)  # Translated text
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)  # Notes
-        self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)  # Remove button
+        # Set column resize modes. The button columns have a known width, so they
+        # are fixed rather than ResizeToContents, which measures every row on
+        # each model reset.
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Fixed)  # Edit button
+        header.resizeSection(0, self.edit_delegate.column_width())
+        header.setSectionResizeMode(1, QHeaderView.Stretch)  # Source text
+        header.setSectionResizeMode(2, QHeaderView.Stretch)  # Translated text
+        header.setSectionResizeMode(3, QHeaderView.Stretch)  # Notes
+        header.setSectionResizeMode(4, QHeaderView.Fixed)  # Remove button
+        header.resizeSection(4, self.remove_delegate.column_width())
         
         # Set row height
         self.table.verticalHeader().setDefaultSectionSize(24)  # Reduced from default
         self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         
-        self.table.setSortingEnabled(True)
         layout.addWidget(self.table)
         
         # Add keyboard shortcut for adding translations
         self.add_shortcut = QShortcut(QKeySequence("Ctrl+Return"), self)
         self.add_shortcut.activated.connect(self.add_translation)
         
-        # Populate table with filtered translations
-        self.update_table()
-        
         # Set window flags to ensure it's a proper window
         self.setWindowFlags(Qt.Window)
     
     def load_translations(self):
         """Load translations from file, backfilling any missing date_added stamps."""
+        self._wait_for_saves()
         try:
             self.translations = self.data_manager.get_language_pair_with_dates(
                 config.source_language,
                 config.target_language,
                 on_warning=lambda msg: QMessageBox.warning(self, "Warning", msg),
+                attach_datetime=False,
             )
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load translations: {str(e)}")
             self.translations = []
     
-    def save_translations(self):
-        """Save translations to file"""
-        try:
-            # Convert current translations to save format
-            save_translations = []
-            for t in self.translations:
-                save_t = t.copy()
-                save_t['date_added'] = save_t['datetime'].strftime(TranslationDataManager.DATE_ADDED_FORMAT)
-                del save_t['datetime']
-                save_translations.append(save_t)
+    def save_translations(self, force=False):
+        """Save translations to file in the background"""
+        # Snapshot the entries as well as the list, since edits in the window
+        # change the entry dicts in place while the write may still be running.
+        # The manager takes ownership of the snapshot rather than copying it again.
+        translations = [dict(t) for t in self.translations]
+        self._save_language_pair(translations, config.source_language, config.target_language, force)
+    
+    def _save_language_pair(self, translations, source_language, target_language, force):
+        self._start_save(
+            lambda: self.data_manager.save_language_pair(
+                translations, source_language, target_language, force=force, copy=False),
+            ('pair', force, translations, source_language, target_language)
+        )
+    
+    def _start_save(self, save, request):
+        runnable = _SaveRunnable(save, request)
+        runnable.signals.finished.connect(self._on_save_finished)
+        self._save_pool.start(runnable)
+    
+    def _wait_for_saves(self):
+        """Block until queued saves are written, before reading the file again."""
+        self._save_pool.waitForDone()
+    
+    def _on_save_finished(self, request, saved, error):
+        if error:
+            QMessageBox.warning(self, "Error", f"Failed to save translations: {error}")
+            return
+        if saved:
+            return
+        if request[0] == 'add':
+            QMessageBox.warning(self, "Error", "Failed to save translation.")
+        elif request[1]:
+            QMessageBox.warning(self, "Error", "Failed to save translations even with force option.")
+        else:
+            # Further refusals while the dialog is open only replace the pending
+            # snapshot, so quick edits after one refusal share a single dialog
+            asking = self._refused_save is not None
+            self._refused_save = request
+            if asking:
+                return
             
-            # Save using new structured API for the current language pair
-            if not self.data_manager.save_language_pair(
-                save_translations,
-                config.source_language,
-                config.target_language
-            ):
-                # If save failed due to potential data loss, ask user
-                reply = QMessageBox.question(
-                    self, 
-                    "Confirm Save",
-                    "Saving these translations would result in significant data loss. Are you sure you want to continue?",
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.No
-                )
-                
-                if reply == QMessageBox.Yes:
-                    # Try again with force=True
-                    if not self.data_manager.save_language_pair(
-                        save_translations,
-                        config.source_language,
-                        config.target_language,
-                        force=True
-                    ):
-                        QMessageBox.warning(self, "Error", "Failed to save translations even with force option.")
-                else:
-                    QMessageBox.information(self, "Save Cancelled", "Translation save was cancelled to prevent data loss.")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to save translations: {str(e)}")
+            # If save failed due to potential data loss, ask user
+            reply = QMessageBox.question(
+                self, 
+                "Confirm Save",
+                "Saving these translations would result in significant data loss. Are you sure you want to continue?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
+            )
+            request, self._refused_save = self._refused_save, None
+            
+            if reply == QMessageBox.Yes:
+                # Try again with force=True, resubmitting the latest refused snapshot
+                # for its own pair, as the selected pair may have changed since
+                _, _, translations, source_language, target_language = request
+                self._save_language_pair(translations, source_language, target_language, True)
+            else:
+                QMessageBox.information(self, "Save Cancelled", "Translation save was cancelled to prevent data loss.")
     
     def update_language_display(self):
         """Update the language display labels when languages change"""
-        self.source_language_label.setText(f"Source: {Language.get_language_name(config.source_language)}")
-        self.target_language_label.setText(f"Target: {Language.get_language_name(config.target_language)}")
-        self.load_translations()  # Reload translations with new language filter
-        self.update_table()
+        self._update_language_labels()
+        if self._loaded:
+            self.load_translations()  # Reload translations with new language filter
+            self.update_table()
+    
+    def showEvent(self, event):
+        """Load translations the first time the window is shown"""
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            self.load_translations()
+            self.update_table()
+    
+    def _update_language_labels(self):
+        """Set the language labels, skipping the lookups when the pair is unchanged."""
+        languages = (config.source_language, config.target_language)
+        if languages == self._displayed_languages:
+            return
+        self._displayed_languages = languages
+        self.source_language_label.setText(f"Source: {Language.get_language_name(languages[0])}")
+        self.target_language_label.setText(f"Target: {Language.get_language_name(languages[1])}")
+    
+    @contextmanager
+    def batch_table_update(self):
+        """Suspend repaints while the table is rebuilt or reordered."""
+        self.table.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.table.setUpdatesEnabled(True)
     
     def update_table(self):
         """Update the table with current translations"""
-        self.table.setRowCount(len(self.translations))
-        for i, trans in enumerate(self.translations):
-            # Edit button
-            edit_button = QPushButton("Edit")
-            edit_button.setFixedSize(50, 20)  # Smaller button size
-            edit_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-            edit_button.setStyleSheet("QPushButton { padding: 0px; margin: 0px; }")
-            edit_button.clicked.connect(lambda checked, idx=i: self.edit_translation(idx))
-            self.table.setCellWidget(i, 0, edit_button)
-            
-            # Source text
-            source_item = QTableWidgetItem(trans['source_text'])
-            self.table.setItem(i, 1, source_item)
-            
-            # Translated text
-            trans_item = QTableWidgetItem(trans['translated_text'])
-            self.table.setItem(i, 2, trans_item)
-            
-            # Notes
-            notes_item = QTableWidgetItem(trans.get('notes', ''))
-            self.table.setItem(i, 3, notes_item)
-            
-            # Remove button
-            remove_button = QPushButton("Remove")
-            remove_button.setFixedSize(60, 20)  # Smaller button size
-            remove_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-            remove_button.setStyleSheet("QPushButton { padding: 0px; margin: 0px; }")
-            remove_button.clicked.connect(lambda checked, idx=i: self.remove_translation(idx))
-            self.table.setCellWidget(i, 4, remove_button)
+        with self.batch_table_update():
+            self.model.set_translations(self.translations)
+    
+    def _on_edit_clicked(self, index):
+        self.edit_translation(self.proxy.mapToSource(index).row())
+    
+    def _on_remove_clicked(self, index):
+        self.remove_translation(self.proxy.mapToSource(index).row())
+    
+    def _filter_now(self):
+        """Apply a pending search immediately instead of waiting for the debounce."""
+        self._filter_timer.stop()
+        self.filter_translations()
     
     def filter_translations(self):
         """Filter translations based on search text"""
-        search_text = self.search_input.text().lower()
-        for i in range(self.table.rowCount()):
-            match = False
-            for j in range(1, 4):  # Skip edit and remove button columns
-                item = self.table.item(i, j)
-                if item and search_text in item.text().lower():
-                    match = True
-                    break
-            self.table.setRowHidden(i, not match)
+        self.proxy.set_search_text(self.search_input.text())
     
     def sort_translations(self):
         """Sort translations based on selected criteria"""
         sort_index = self.sort_combo.currentIndex()
-        if sort_index == 0:  # Date Added (Newest)
-            self.translations.sort(key=lambda x: x['datetime'], reverse=True)
-        elif sort_index == 1:  # Date Added (Oldest)
-            self.translations.sort(key=lambda x: x['datetime'])
-        elif sort_index == 2:  # Source Text
-            self.translations.sort(key=lambda x: x['source_text'].lower())
-        elif sort_index == 3:  # Translated Text
-            self.translations.sort(key=lambda x: x['translated_text'].lower())
-        self.update_table()
+        with self.batch_table_update():
+            if sort_index == 0:  # Date Added (Newest)
+                self.model.sort_rows(TranslationsModel.DATE_KEY, reverse=True)
+            elif sort_index == 1:  # Date Added (Oldest)
+                self.model.sort_rows(TranslationsModel.DATE_KEY)
+            elif sort_index == 2:  # Source Text
+                self.model.sort_rows(TranslationsModel.SOURCE_KEY)
+            elif sort_index == 3:  # Translated Text
+                self.model.sort_rows(TranslationsModel.TRANSLATED_KEY)
+
     
     def add_translation(self):
         """Add a new translation"""
         dialog = TranslationDialog(self)
         if dialog.exec_():
             new_t = {
-                'datetime': datetime.now(),
+                'date_added': TranslationDataManager.format_date_added(datetime.now()),
                 'source_text': dialog.source_text,
                 'translated_text': dialog.translated_text,
                 'notes': dialog.notes,
                 'source_language': config.source_language,
                 'target_language': config.target_language
             }
-            self.translations.insert(0, new_t)
-            self.save_translations()
-            self.update_table()
+            self.model.insert_translation(0, new_t)
+            # A single new entry only needs to be inserted, not the whole pair re-saved.
+            # The manager owns this copy, as the window may edit new_t in place.
+            saved_t = dict(new_t)
+            self._start_save(
+                lambda: self.data_manager.add_translation(saved_t, index=0, copy=False), ('add',))
     
     def edit_translation(self, index):
         """Edit an existing translation"""
         dialog = TranslationDialog(self, self.translations[index])
         if dialog.exec_():
-            self.translations[index].update({
+            self.model.update_translation(index, {
                 'source_text': dialog.source_text,
                 'translated_text': dialog.translated_text,
                 'notes': dialog.notes
             })
             self.save_translations()
-            self.update_table()
     
     def remove_translation(self, index):
         """Remove a translation"""
@@ -266,9 +571,8 @@ class TranslationsWindow(SmartWindow):
         )
         
         if reply == QMessageBox.Yes:
-            del self.translations[index]
+            self.model.remove_translation(index)
             self.save_translations()
-            self.update_table()
 
     # ---- Import ---------------------------------------------------------
 
@@ -353,6 +657,7 @@ class TranslationsWindow(SmartWindow):
         if reply != QMessageBox.Yes:
             return
 
+        self._wait_for_saves()
         try:
             existing = self.data_manager.get_language_pair(source_language, target_language) or []
         except Exception as e:
@@ -382,10 +687,10 @@ class TranslationsWindow(SmartWindow):
         imported_count = 0
         save_failed = False
         if unique_new:
-            combined = existing + unique_new
-            if self.data_manager.save_language_pair(
-                combined, source_language, target_language, force=True
-            ):
+            # Append the new rows with a single backup and write, rather than
+            # re-saving the whole pair. The rows were built for this import, so
+            # the manager can keep them without copying.
+            if self.data_manager.add_translations(unique_new, copy=False):
                 imported_count = len(unique_new)
             else:
                 save_failed = True
@@ -550,7 +855,7 @@ class TranslationsWindow(SmartWindow):
 
             date_added = self._coerce_str(raw.get('date_added'))
             if not date_added:
-                date_added = datetime.now().strftime(TranslationDataManager.DATE_ADDED_FORMAT)
+                date_added = TranslationDataManager.format_date_added(datetime.now())
 
             valid.append({
                 'source_text': source_text,
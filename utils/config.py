@@ -1,20 +1,78 @@
 import json
 import os
+from pathlib import Path
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from utils.globals import Globals
 from utils.utils import Utils
 from utils.logging_setup import get_logger
 
 logger = get_logger("config")
 
+_MISSING = object()
+
 root_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 configs_dir = os.path.join(root_dir, "configs")
 library_data_dir = os.path.join(root_dir, "library_data", "data")
 
 
+def _load_config_file(path):
+    """Parse a JSON config file from a single bytes read, using orjson when it is available."""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class Config:
     CONFIGS_DIR_LOC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "configs")
 
+    # Values read from the config file, grouped by the type they are coerced to
+    VALUE_SCHEMA = (
+        (str, (
+            "foreground_color",
+            "background_color",
+            "source_language",
+            "target_language",
+            "proficiency_level",
+            "llm_model_name",
+            "vocabulary_difficulty",
+            "grammar_difficulty",
+            "ui_language",
+            "blacklist_file",
+            "backup_dir",
+        )),
+        (int, (
+            "max_chunk_tokens",
+            "daily_goal_minutes",
+            "font_size",
+            "server_port",
+        )),
+        (list, (
+            "learning_focus",
+            "text_cleaner_ruleset",
+            "coqui_tts_model",
+            "save_tts_output_topics",
+        )),
+        (bool, (
+            "enable_visual_learning",
+            "enable_pronunciation_practice",
+            "enable_cultural_context",
+            "enable_situational_dialogues",
+            "show_videos_in_main_window",
+            "play_videos_in_separate_window",
+            "enable_dark_mode",
+            "debug",
+            "disable_tts",
+            "ignore_missing_api_keys",
+        )),
+    )
+
     def __init__(self):
         self.dict = {}
         self.foreground_color = "white"
@@ -42,7 +100,7 @@ class Config:
         
         # LLM and TTS configuration
         self.llm_model_name = "deepseek-r1:14b"
-        self.coqui_tts_location = os.path.join(os.path.expanduser("~"), "TTS-dev")  # Default location
+        self.coqui_tts_location = os.path.join(Globals.HOME, "TTS-dev")  # Default location
         self.disable_tts = False  # Set to True to disable TTS functionality for testing
 
         self.text_cleaner_ruleset = []
@@ -87,40 +145,28 @@ class Config:
         }
         self.ignore_missing_api_keys = False  # Set to True to skip API-dependent tests
 
-        # Load configuration from file
-        configs = [f.path for f in os.scandir(Config.CONFIGS_DIR_LOC) if f.is_file() and f.path.endswith(".json")]
-        self.config_path = None
-
-        for c in configs:
-            if os.path.basename(c) == "config.json":
-                self.config_path = c
-                break
-            elif os.path.basename(c) != "config_example.json":
-                self.config_path = c
+        # Load configuration from file, scanning the configs directory only
+        # when the usual config.json is not there
+        self.config_path = os.path.join(Config.CONFIGS_DIR_LOC, "config.json")
+        if not os.path.isfile(self.config_path):
+            self.config_path = None
+            with os.scandir(Config.CONFIGS_DIR_LOC) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.name != "config_example.json" and entry.is_file():
+                        self.config_path = entry.path
 
         if self.config_path is None:
             self.config_path = os.path.join(Config.CONFIGS_DIR_LOC, "config_example.json")
 
         try:
-            self.dict = json.load(open(self.config_path, "r", encoding="utf-8"))
+            self.dict = _load_config_file(self.config_path)
         except Exception as e:
             logger.error(e)
             logger.warning("Unable to load config. Ensure config.json file settings are correct.")
 
         # Set values from config file
-        self.set_values(str,
-            "foreground_color",
-            "background_color",
-            "source_language",
-            "target_language",
-            "proficiency_level",
-            "llm_model_name",
-            "vocabulary_difficulty",
-            "grammar_difficulty",
-            "ui_language",
-            "blacklist_file",
-            "backup_dir",
-        )
+        for value_type, names in Config.VALUE_SCHEMA:
+            self.set_values(value_type, *names)
         
         # Set API keys from config
         if "api_keys" in self.dict:
@@ -128,33 +174,6 @@ class Config:
                 if key in self.dict["api_keys"]:
                     self.api_keys[key] = self.dict["api_keys"][key]
         
-        self.set_values(int,
-            "max_chunk_tokens",
-            "daily_goal_minutes",
-            "font_size",
-            "server_port",
-        )
-        
-        self.set_values(list,
-            "learning_focus",
-            "text_cleaner_ruleset",
-            "coqui_tts_model",
-            "save_tts_output_topics",
-        )
-        
-        self.set_values(bool,
-            "enable_visual_learning",
-            "enable_pronunciation_practice",
-            "enable_cultural_context",
-            "enable_situational_dialogues",
-            "show_videos_in_main_window",
-            "play_videos_in_separate_window",
-            "enable_dark_mode",
-            "debug",
-            "disable_tts",
-            "ignore_missing_api_keys",
-        )
-        
         self.set_directories(
             "prompts_directory",
             "coqui_tts_location",
@@ -172,7 +191,7 @@ class Config:
         loc = key if override else self.dict[key]
         if loc and loc.strip() != "":
             if "{HOME}" in loc:
-                loc = loc.strip().replace("{HOME}", os.path.expanduser("~"))
+                loc = loc.strip().replace("{HOME}", Globals.HOME)
             if not sys.platform == "win32" and "\\" in loc:
                 loc = loc.replace("\\", "/")
             if not Utils.isdir_with_retry(loc):
@@ -190,18 +209,16 @@ class Config:
 
     def set_values(self, type, *names):
         for name in names:
-            if type:
-                try:
-                    setattr(self, name, type(self.dict[name]))
-                except Exception as e:
-                    logger.error(e)
-                    logger.warning(f"Failed to set {name} from config.json file. Ensure the value is set and of the correct type.")
-            else:
-                try:
-                    setattr(self, name, self.dict[name])
-                except Exception as e:
-                    logger.error(e)
-                    logger.warning(f"Failed to set {name} from config.json file. Ensure the key is set.")
+            # A missing key is common and needs no exception to detect
+            value = self.dict.get(name, _MISSING)
+            if value is _MISSING:
+                logger.warning(f"Failed to set {name} from config.json file. Ensure the key is set.")
+                continue
+            try:
+                setattr(self, name, type(value) if type else value)
+            except Exception as e:
+                logger.error(e)
+                logger.warning(f"Failed to set {name} from config.json file. Ensure the value is set and of the correct type.")
 
 
     def get_subdirectories(self):
@@ -24,6 +24,12 @@ class Globals:
     def set_volume(cls, volume=60):
         cls.DEFAULT_VOLUME_THRESHOLD = int(volume)
 
+# Language display names per UI locale, see Language.get_language_name
+_language_names_by_locale = {}
+# Reverse of the above, see Language.get_language_code
+_language_codes_by_locale = {}
+
+
 class Language(Enum):
     """Supported languages with ISO 639-1 language codes as values."""
     ENGLISH = "en"
@@ -36,20 +42,17 @@ class Language(Enum):
     @classmethod
     def get_all_codes(cls):
         """Get a list of all language codes."""
-        return [lang.value for lang in cls]
+        return list(_LANGUAGES_BY_CODE)
     
     @classmethod
     def from_code(cls, code):
         """Get Language enum member from language code."""
-        for lang in cls:
-            if lang.value == code:
-                return lang
-        return None
+        return _LANGUAGES_BY_CODE.get(code)
     
     @classmethod
     def is_supported(cls, code):
         """Check if a language code is supported."""
-        return cls.from_code(code) is not None
+        return code in _LANGUAGES_BY_CODE
     
     @classmethod
     def get_language_name(cls, lang_code):
@@ -57,15 +60,18 @@ class Language(Enum):
         # Lazy import to avoid circular dependency
         from utils.translations import I18N
         
-        # Map language codes to their display names
-        lang_name_map = {
-            cls.ENGLISH.value: I18N._("English"),
-            cls.GERMAN.value: I18N._("German"),
-            cls.FRENCH.value: I18N._("French"),
-            cls.SPANISH.value: I18N._("Spanish"),
-            cls.ITALIAN.value: I18N._("Italian"),
-            cls.LATIN.value: I18N._("Latin"),
-        }
+        # Map language codes to their display names, built once per locale
+        lang_name_map = _language_names_by_locale.get(I18N.locale)
+        if lang_name_map is None:
+            lang_name_map = {
+                cls.ENGLISH.value: I18N._("English"),
+                cls.GERMAN.value: I18N._("German"),
+                cls.FRENCH.value: I18N._("French"),
+                cls.SPANISH.value: I18N._("Spanish"),
+                cls.ITALIAN.value: I18N._("Italian"),
+                cls.LATIN.value: I18N._("Latin"),
+            }
+            _language_names_by_locale[I18N.locale] = lang_name_map
         
         return lang_name_map.get(lang_code, lang_code)  # Return the code if no translation is available
     
@@ -75,18 +81,34 @@ class Language(Enum):
         # Lazy import to avoid circular dependency
         from utils.translations import I18N
         
-        # Create a mapping of translated names to codes
-        lang_map = {
-            I18N._("English"): cls.ENGLISH.value,
-            I18N._("German"): cls.GERMAN.value,
-            I18N._("French"): cls.FRENCH.value,
-            I18N._("Spanish"): cls.SPANISH.value,
-            I18N._("Italian"): cls.ITALIAN.value,
-            I18N._("Latin"): cls.LATIN.value,
-        }
+        # Map translated names to codes, built once per locale
+        lang_map = _language_codes_by_locale.get(I18N.locale)
+        if lang_map is None:
+            lang_map = {
+                I18N._("English"): cls.ENGLISH.value,
+                I18N._("German"): cls.GERMAN.value,
+                I18N._("French"): cls.FRENCH.value,
+                I18N._("Spanish"): cls.SPANISH.value,
+                I18N._("Italian"): cls.ITALIAN.value,
+                I18N._("Latin"): cls.LATIN.value,
+            }
+            _language_codes_by_locale[I18N.locale] = lang_map
         return lang_map.get(lang_name, lang_name)  # Return the code if found, otherwise return the input
 
 
+_LANGUAGES_BY_CODE = {lang.value: lang for lang in Language}
+
+
+class ProficiencyLevel(Enum):
+    """Learner proficiency levels, valued as stored in the config."""
+    BEGINNER = "beginner"
+    INTERMEDIATE = "intermediate"
+    ADVANCED = "advanced"
+
+    def get_display_name(self):
+        return self.value.capitalize()
+
+
 class MediaFileType(Enum):
     MKV = '.MKV'
     MP4 = '.MP4'
@@ -123,12 +145,11 @@ class MediaFileType(Enum):
 
     @classmethod
     def is_media_filetype(cls, filename):
-        f = filename.upper()
-        for e in cls:
-            if f.endswith(e.value):
-                return True
-        return False
+        # str.endswith checks the whole tuple of suffixes in one call
+        return filename.upper().endswith(_MEDIA_EXTENSIONS)
+
 
+_MEDIA_EXTENSIONS = tuple(e.value for e in MediaFileType)
 
 
 class Topic(Enum):
@@ -153,51 +174,48 @@ class Topic(Enum):
     LANGUAGE_LEARNING = "language_learning"
 
     def translate(self):
-        if self == Topic.WEATHER:
-            return _("weather")
-        elif self == Topic.NEWS:
-            return _("news")
-        elif self == Topic.HACKERNEWS:
-            return "hacker news"
-        elif self == Topic.JOKE:
-            return _("joke")
-        elif self == Topic.FACT:
-            return _("fact")
-        elif self == Topic.FABLE:
-            return _("fable")
-        elif self == Topic.TRUTH_AND_LIE:
-            return _("truth and lie")
-        elif self == Topic.APHORISM:
-            return _("aphorism")
-        elif self == Topic.POEM:
-            return _("poem")
-        elif self == Topic.QUOTE:
-            return _("quote")
-        elif self == Topic.TONGUE_TWISTER:
-            return _("tongue twister")
-        elif self == Topic.MOTIVATION:
-            return _("motivation")
-        elif self == Topic.CALENDAR:
-            return _("calendar")
-        elif self == Topic.TRACK_CONTEXT_PRIOR:
-            return _("more about the next track")
-        elif self == Topic.TRACK_CONTEXT_POST:
-            return _("more about the last track")
-        elif self == Topic.PLAYLIST_CONTEXT:
-            return _("more about our playlist")
-        elif self == Topic.RANDOM_WIKI_ARTICLE:
-            return _("random wiki article")
-        elif self == Topic.FUNNY_STORY:
-            return _("funny story")
-        elif self == Topic.LANGUAGE_LEARNING:
-            return  _("language learning")
-        else:
+        # Resolve every label once per locale, then reuse the strings
+        labels = _topic_labels_by_locale.get(I18N.locale)
+        if labels is None:
+            labels = {topic: label() for topic, label in _TOPIC_LABELS.items()}
+            _topic_labels_by_locale[I18N.locale] = labels
+        label = labels.get(self)
+        if label is None:
             raise Exception(f"unhandled topic: {self}")
+        return label
 
     def get_prompt_topic_value(self):
-        if self == Topic.HACKERNEWS:
-            return "news"
-        return str(self.value)
+        return _TOPIC_PROMPT_VALUES[self]
+
+
+# Label for each topic, kept as _() literals for string extraction. The
+# translated strings are cached per UI locale, see Topic.translate
+_TOPIC_LABELS = {
+    Topic.WEATHER: lambda: _("weather"),
+    Topic.NEWS: lambda: _("news"),
+    Topic.HACKERNEWS: lambda: "hacker news",
+    Topic.JOKE: lambda: _("joke"),
+    Topic.FACT: lambda: _("fact"),
+    Topic.FABLE: lambda: _("fable"),
+    Topic.TRUTH_AND_LIE: lambda: _("truth and lie"),
+    Topic.APHORISM: lambda: _("aphorism"),
+    Topic.POEM: lambda: _("poem"),
+    Topic.QUOTE: lambda: _("quote"),
+    Topic.TONGUE_TWISTER: lambda: _("tongue twister"),
+    Topic.MOTIVATION: lambda: _("motivation"),
+    Topic.CALENDAR: lambda: _("calendar"),
+    Topic.TRACK_CONTEXT_PRIOR: lambda: _("more about the next track"),
+    Topic.TRACK_CONTEXT_POST: lambda: _("more about the last track"),
+    Topic.PLAYLIST_CONTEXT: lambda: _("more about our playlist"),
+    Topic.RANDOM_WIKI_ARTICLE: lambda: _("random wiki article"),
+    Topic.FUNNY_STORY: lambda: _("funny story"),
+    Topic.LANGUAGE_LEARNING: lambda: _("language learning"),
+}
+_topic_labels_by_locale = {}
+
+# Topic name used to pick the prompt file, see Topic.get_prompt_topic_value
+_TOPIC_PROMPT_VALUES = {topic: topic.value for topic in Topic}
+_TOPIC_PROMPT_VALUES[Topic.HACKERNEWS] = "news"
 
 
 class ImageGenerationType(Enum):
@@ -214,12 +232,15 @@ class ImageGenerationType(Enum):
 
     @staticmethod
     def get(name):
-        for key, value in ImageGenerationType.__members__.items():
-            if str(value) == name:
-                return value
-        raise Exception(f"Not a valid prompt mode: {name}")
+        value = _IMAGE_GENERATION_TYPES_BY_VALUE.get(name)
+        if value is None:
+            raise Exception(f"Not a valid prompt mode: {name}")
+        return value
 
     @staticmethod
     def members():
-        return [str(value) for key, value in ImageGenerationType.__members__.items()]
+        return list(_IMAGE_GENERATION_TYPES_BY_VALUE)
+
+
+_IMAGE_GENERATION_TYPES_BY_VALUE = {str(value): value for value in ImageGenerationType}
 
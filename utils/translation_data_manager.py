@@ -1,16 +1,96 @@
 import json
+import mmap
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
 import appdirs
 from collections import defaultdict
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 from utils.config import config
 from utils.logging_setup import get_logger
 from utils.utils import Utils
 
 logger = get_logger("translation_data_manager")
 
+# Below this size a plain read is cheaper than setting up a memory map
+MMAP_MIN_BYTES = 1024 * 1024
+
+
+def _read_json(path):
+    """Load a JSON file, using orjson or else ujson when either is available.
+
+    orjson parses large files straight from a memory map, which avoids holding
+    a second full-size copy of the file as bytes while it is parsed.
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    # Both parsers take the raw bytes, which skips decoding the whole file to a
+    # str before parsing it
+    if ujson is not None:
+        return ujson.loads(Path(path).read_bytes())
+    return json.loads(Path(path).read_bytes())
+
+
+def _write_json(path, data):
+    """Write data as compact UTF-8 JSON, using orjson or else ujson when either is available.
+
+    The data is written to a temporary file that then replaces `path`, so an
+    interrupted save never leaves a truncated file behind.
+    """
+    tmp_path = f"{path}.tmp"
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+    elif ujson is not None:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False))
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _link_or_copy(src, dst):
+    """Make `dst` a snapshot of `src`, by hard link where the filesystem allows.
+
+    The data file is only ever replaced by _write_json, never written in place,
+    so a link keeps the old contents after the next save without copying them.
+    """
+    tmp_path = f"{dst}.tmp"
+    try:
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+        os.link(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 
 class TranslationDataManager:
     """Manages translation data with structured storage by language pairs"""
@@ -27,12 +107,32 @@ class TranslationDataManager:
             unparseable, in which case `datetime.now()` is returned.
         """
         if isinstance(raw_value, str) and raw_value.strip():
+            value = raw_value.strip()
             try:
-                return datetime.strptime(raw_value.strip(), cls.DATE_ADDED_FORMAT), False
+                # fromisoformat is far cheaper than strptime for the canonical
+                # zero-padded form; anything else still goes through strptime.
+                # fromisoformat also accepts "T" separators and UTC offsets, so
+                # only strings laid out exactly as DATE_ADDED_FORMAT take it.
+                if cls._is_canonical_date_added(value):
+                    parsed = datetime.fromisoformat(value)
+                    if parsed.tzinfo is None:
+                        return parsed, False
+                return datetime.strptime(value, cls.DATE_ADDED_FORMAT), False
             except ValueError:
                 pass
         return datetime.now(), True
 
+    @staticmethod
+    def _is_canonical_date_added(value):
+        """Check that a string has the "YYYY-MM-DD HH:MM:SS" layout of DATE_ADDED_FORMAT."""
+        return (len(value) == 19 and value[4] == '-' and value[7] == '-' and value[10] == ' '
+                and value[13] == ':' and value[16] == ':')
+
+    @classmethod
+    def format_date_added(cls, value):
+        """Format a datetime as a date_added string (DATE_ADDED_FORMAT)."""
+        return value.isoformat(sep=' ', timespec='seconds')
+
     
     def __init__(self):
         # Use appdirs to get proper cache directory
@@ -43,6 +143,9 @@ class TranslationDataManager:
         self.data_file = self.data_dir / "translations_structured.json"
         self.backup_file = self.data_dir / "translations_structured_backup.json"
         self.user_backup_file = None
+        # Last parsed contents of data_file, valid while the file's stamp matches
+        self._structured_data = None
+        self._structured_data_stamp = None
         
         logger.debug(f"Data file: {self.data_file}")
         logger.debug(f"Backup file: {self.backup_file}")
@@ -79,8 +182,7 @@ class TranslationDataManager:
             logger.info("Migrating from old flat format to structured format...")
             
             # Load old format
-            with open(old_data_file, 'r', encoding='utf-8') as f:
-                old_translations = json.load(f)
+            old_translations = _read_json(old_data_file)
             
             if not old_translations:
                 logger.info("No translations to migrate")
@@ -103,8 +205,7 @@ class TranslationDataManager:
                 structured_data[pair_key].append(trans)
             
             # Save new format
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(structured_data, f, ensure_ascii=False, indent=2)
+            self._save_structured_data(structured_data)
             
             # Backup old file
             old_backup = old_data_file.with_suffix('.json.old')
@@ -119,24 +220,37 @@ class TranslationDataManager:
     def get_language_pair(self, source_language, target_language):
         """Get all translations for a specific language pair"""
         try:
+            pair_key = f"{source_language}-{target_language}"
+            
+            # A current cache implies the data file exists, so check it first
+            structured_data = self._cached_structured_data()
+            if structured_data is not None:
+                # Copy the entries so callers can modify them without touching the cache
+                return [dict(t) for t in structured_data.get(pair_key, ())]
+            
             if not Utils.exists_with_retry(str(self.data_file)):
                 return self._load_from_backup_pair(source_language, target_language)
             
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                structured_data = json.load(f)
+            if ijson is not None:
+                # Stream only the requested pair rather than materializing every pair
+                with open(self.data_file, 'rb') as f:
+                    return list(ijson.items(f, f"{pair_key}.item", use_float=True))
+            
+            structured_data = _read_json(self.data_file)
             
-            pair_key = f"{source_language}-{target_language}"
             return structured_data.get(pair_key, [])
             
         except Exception as e:
             logger.error(f"Error loading language pair {source_language}-{target_language}: {e}")
             return self._load_from_backup_pair(source_language, target_language)
 
-    def get_language_pair_with_dates(self, source_language, target_language, on_warning=None):
+    def get_language_pair_with_dates(self, source_language, target_language, on_warning=None,
+                                     attach_datetime=True):
         """Load a language pair, backfill missing date_added values, and attach a parsed datetime.
 
         Each returned entry is mutated in place to include a `datetime` key for
-        in-memory use. Any rows whose `date_added` was missing or unparseable are
+        in-memory use, unless `attach_datetime` is False, in which case entries
+        keep only their persisted fields and can be saved back as-is. Any rows whose `date_added` was missing or unparseable are
         stamped with the current time and persisted back to disk so the same
         rows aren't re-stamped on subsequent loads.
 
@@ -145,6 +259,7 @@ class TranslationDataManager:
             target_language: target language code
             on_warning: optional callable(str) used to surface non-fatal warnings,
                 e.g. when the persistence step fails. Warnings are always logged.
+            attach_datetime: whether to add the parsed `datetime` to each entry.
 
         Returns:
             list[dict]: language pair entries with `datetime` attached.
@@ -155,14 +270,15 @@ class TranslationDataManager:
         for t in translations:
             parsed, was_repaired = self.parse_or_stamp_date_added(t.get('date_added'))
             if was_repaired:
-                t['date_added'] = parsed.strftime(self.DATE_ADDED_FORMAT)
+                t['date_added'] = self.format_date_added(parsed)
                 backfilled = True
-            t['datetime'] = parsed
+            if attach_datetime:
+                t['datetime'] = parsed
 
         if backfilled:
             try:
                 # `datetime` is an in-memory convenience; strip it before persisting.
-                persistable = [
+                persistable = translations if not attach_datetime else [
                     {k: v for k, v in t.items() if k != 'datetime'}
                     for t in translations
                 ]
@@ -188,33 +304,37 @@ class TranslationDataManager:
         return translations
 
     
-    def save_language_pair(self, translations, source_language, target_language, force=False):
-        """Save translations for a specific language pair"""
+    def save_language_pair(self, translations, source_language, target_language, force=False, copy=True):
+        """Save translations for a specific language pair.
+
+        The entries are copied unless `copy` is False, which hands ownership of the
+        list and its dicts to the manager; the caller must not change them afterwards.
+        """
         try:
             if not source_language or not target_language:
                 logger.error("Source and target language must be specified")
                 return False
             
-            # Create backup before saving
-            self._create_backup()
-            
             # Load existing structured data
             existing_data = self._load_structured_data()
             
             pair_key = f"{source_language}-{target_language}"
             
             # Check if we're about to lose significant data
-            existing_for_pair = existing_data.get(pair_key, [])
-            if not force and existing_for_pair and self._would_lose_data_for_pair(existing_for_pair, translations):
+            existing_count = len(existing_data.get(pair_key, ()))
+            if not force and self._would_lose_data_for_pair(existing_count, len(translations)):
                 logger.warning(f"Would lose data for {pair_key}. Use force=True to override.")
                 return False
             
-            # Update the pair
-            existing_data[pair_key] = translations
+            # Create backup before saving
+            self._create_backup()
+            
+            # Update the pair with copies of the entries, so later changes to the
+            # caller's list or dicts can't alter the cached data
+            existing_data[pair_key] = [dict(t) for t in translations] if copy else translations
             
             # Save
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, ensure_ascii=False, indent=2)
+            self._save_structured_data(existing_data)
             
             logger.info(f"Saved {len(translations)} translations for {pair_key}")
             return True
@@ -223,8 +343,13 @@ class TranslationDataManager:
             logger.error(f"Error saving language pair {source_language}-{target_language}: {e}")
             return False
     
-    def add_translation(self, translation):
-        """Add a single translation to the appropriate language pair"""
+    def add_translation(self, translation, index=None, copy=True):
+        """Add a single translation to the appropriate language pair.
+
+        The translation is appended unless `index` is given, in which case it is
+        inserted at that position within its language pair. It is copied unless
+        `copy` is False, in which case the caller must not change it afterwards.
+        """
         try:
             source = translation.get('source_language')
             target = translation.get('target_language')
@@ -245,12 +370,16 @@ class TranslationDataManager:
             if pair_key not in existing_data:
                 existing_data[pair_key] = []
             
-            # Add translation
-            existing_data[pair_key].append(translation)
+            # Add a copy of the translation, as the caller may keep changing it
+            if copy:
+                translation = dict(translation)
+            if index is None:
+                existing_data[pair_key].append(translation)
+            else:
+                existing_data[pair_key].insert(index, translation)
             
             # Save
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, ensure_ascii=False, indent=2)
+            self._save_structured_data(existing_data)
             
             logger.debug(f"Added translation to {pair_key}")
             return True
@@ -259,14 +388,84 @@ class TranslationDataManager:
             logger.error(f"Error adding translation: {e}")
             return False
     
+    def add_translations(self, translations, copy=True):
+        """Append many translations to their language pairs with a single backup and write.
+
+        The entries are copied unless `copy` is False, in which case the caller must
+        not change them afterwards.
+        """
+        try:
+            translations_by_pair = defaultdict(list)
+            for translation in translations:
+                source = translation.get('source_language')
+                target = translation.get('target_language')
+                
+                if not source or not target:
+                    logger.warning(f"Skipping translation without language info: {translation.get('source_text', 'Unknown')}")
+                    continue
+                
+                translations_by_pair[f"{source}-{target}"].append(dict(translation) if copy else translation)
+            
+            if not translations_by_pair:
+                return True
+            
+            # Create backup
+            self._create_backup()
+            
+            # Load existing structured data
+            existing_data = self._load_structured_data()
+            
+            for pair_key, pair_translations in translations_by_pair.items():
+                existing_data.setdefault(pair_key, []).extend(pair_translations)
+            
+            # Save
+            self._save_structured_data(existing_data)
+            
+            logger.info(f"Added {sum(map(len, translations_by_pair.values()))} translations to {len(translations_by_pair)} language pairs")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error adding translations: {e}")
+            return False
+    
+    def save_language_pairs(self, translations_by_pair, force=False):
+        """Save translations for several language pairs with a single backup and write.
+
+        `translations_by_pair` maps pair keys ("source-target") to the complete list
+        for that pair. Nothing is saved if any pair would lose significant data.
+        """
+        try:
+            # Load existing structured data
+            existing_data = self._load_structured_data()
+            
+            # Check if we're about to lose significant data
+            if not force:
+                for pair_key, translations in translations_by_pair.items():
+                    existing_count = len(existing_data.get(pair_key, ()))
+                    if self._would_lose_data_for_pair(existing_count, len(translations)):
+                        logger.warning(f"Would lose data for {pair_key}. Use force=True to override.")
+                        return False
+            
+            # Create backup before saving
+            self._create_backup()
+            
+            for pair_key, translations in translations_by_pair.items():
+                existing_data[pair_key] = [dict(t) for t in translations]
+            
+            # Save
+            self._save_structured_data(existing_data)
+            
+            logger.info(f"Saved translations for {len(translations_by_pair)} language pairs")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error saving language pairs: {e}")
+            return False
+    
     def get_all_language_pairs(self):
         """Get all language pairs in the database"""
         try:
-            if not Utils.exists_with_retry(str(self.data_file)):
-                return {}
-            
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                structured_data = json.load(f)
+            structured_data = self._load_structured_data()
             
             # Return as sorted list of pairs
             return sorted(structured_data.keys())
@@ -278,11 +477,7 @@ class TranslationDataManager:
     def get_translation_stats(self):
         """Get statistics about translations"""
         try:
-            if not Utils.exists_with_retry(str(self.data_file)):
-                return {"total": 0, "by_pair": {}}
-            
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                structured_data = json.load(f)
+            structured_data = self._load_structured_data()
             
             stats = {"total": 0, "by_pair": {}}
             
@@ -313,8 +508,7 @@ class TranslationDataManager:
                 del existing_data[pair_key]
                 
                 # Save
-                with open(self.data_file, 'w', encoding='utf-8') as f:
-                    json.dump(existing_data, f, ensure_ascii=False, indent=2)
+                self._save_structured_data(existing_data)
                 
                 logger.info(f"Deleted {deleted_count} translations for {pair_key}")
                 return True
@@ -327,49 +521,98 @@ class TranslationDataManager:
             return False
     
     def _load_structured_data(self):
-        """Load structured data, creating empty dict if file doesn't exist"""
+        """Load structured data, creating empty dict if file doesn't exist.
+
+        The parsed data is kept and reused until the file's modification time or
+        size changes, so repeated saves don't re-parse the whole file. Callers
+        that change the returned dict must save it with _save_structured_data.
+        """
         try:
-            if not Utils.exists_with_retry(str(self.data_file)):
+            # One stat both checks for the file and validates the cache
+            stamp = self._data_file_stamp()
+            if stamp is None:
                 return {}
+            if stamp == self._structured_data_stamp:
+                return self._structured_data
             
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            structured_data = _read_json(self.data_file)
+            self._structured_data = structured_data
+            self._structured_data_stamp = stamp
+            return structured_data
                 
         except Exception as e:
             logger.error(f"Error loading structured data: {e}")
             return {}
     
+    def _save_structured_data(self, structured_data):
+        """Write structured data to the data file and keep it as the cached copy"""
+        try:
+            _write_json(self.data_file, structured_data)
+        except Exception:
+            # The cached dict may hold changes that never reached the file
+            self._structured_data = None
+            self._structured_data_stamp = None
+            raise
+        self._structured_data = structured_data
+        self._structured_data_stamp = self._data_file_stamp()
+    
+    def _cached_structured_data(self):
+        """Return the cached structured data if the data file hasn't changed since, else None"""
+        if self._structured_data_stamp is None:
+            return None
+        try:
+            if self._data_file_stamp() == self._structured_data_stamp:
+                return self._structured_data
+        except OSError:
+            pass
+        return None
+    
+    def _data_file_stamp(self):
+        """Return the data file's (mtime, size), or None if it doesn't exist"""
+        try:
+            stat = self.data_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
     def _create_backup(self):
         """Create a backup of the current structured data file"""
-        if not Utils.exists_with_retry(str(self.data_file)):
-            return
-        
         try:
             # Create automatic backup in cache directory
-            shutil.copy2(self.data_file, self.backup_file)
-            
-            # Create backup in user-specified location if configured
-            if self.user_backup_file and Utils.isdir_with_retry(str(self.user_backup_file.parent)):
-                self.user_backup_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(self.data_file, self.user_backup_file)
-                
+            _link_or_copy(self.data_file, self.backup_file)
+        except FileNotFoundError:
+            return  # Nothing saved yet, so nothing to back up
         except Exception as e:
             logger.error(f"Error creating backup: {e}")
+        
+        # Create backup in user-specified location if configured. Its directory
+        # was checked in __init__, so only re-check (and wait for a sleeping
+        # drive) if the backup fails.
+        if self.user_backup_file:
+            try:
+                _link_or_copy(self.data_file, self.user_backup_file)
+            except OSError:
+                try:
+                    if Utils.isdir_with_retry(str(self.user_backup_file.parent)):
+                        _link_or_copy(self.data_file, self.user_backup_file)
+                except Exception as e:
+                    logger.error(f"Error creating user backup: {e}")
     
     def _load_from_backup_pair(self, source_language, target_language):
         """Load a specific language pair from backup"""
         try:
             backup_data = None
             
-            # Try user-specified backup first
-            if self.user_backup_file and Utils.exists_with_retry(str(self.user_backup_file)):
-                with open(self.user_backup_file, 'r', encoding='utf-8') as f:
-                    backup_data = json.load(f)
-            
-            # Fall back to automatic backup
-            elif Utils.exists_with_retry(str(self.backup_file)):
-                with open(self.backup_file, 'r', encoding='utf-8') as f:
-                    backup_data = json.load(f)
+            # Try user-specified backup first, then fall back to automatic backup.
+            # Opening directly saves a stat per file over checking existence first.
+            for backup_file in (self.user_backup_file, self.backup_file):
+                if backup_file is None:
+                    continue
+                try:
+                    backup_data = _read_json(backup_file)
+                    break
+                except FileNotFoundError:
+                    continue
             
             if backup_data:
                 pair_key = f"{source_language}-{target_language}"
@@ -381,22 +624,15 @@ class TranslationDataManager:
             logger.error(f"Error loading from backup for {source_language}-{target_language}: {e}")
             return []
     
-    def _would_lose_data_for_pair(self, existing_for_pair, new_translations):
-        """Check if saving new translations for a specific language pair would result in significant data loss"""
-        try:
-            # If there are fewer than 10 translations for this pair, don't check for data loss
-            if len(existing_for_pair) < 10:
-                return False
-
-            # Consider it significant data loss if we're losing more than 10% of entries for this pair
-            current_count = len(existing_for_pair)
-            new_count = len(new_translations)
-            
-            return new_count < current_count * 0.9
-            
-        except Exception:
+    def _would_lose_data_for_pair(self, current_count, new_count):
+        """Check if replacing current_count translations for a language pair with new_count would result in significant data loss"""
+        # If there are fewer than 10 translations for this pair, don't check for data loss
+        if current_count < 10:
             return False
 
+        # Consider it significant data loss if we're losing more than 10% of entries for this pair
+        return new_count < current_count * 0.9
+
 
 # Helper function for backward compatibility during transition
 def get_legacy_compatible_manager():
@@ -410,35 +646,24 @@ def get_legacy_compatible_manager():
         
         def load_translations(self, source_language=None, target_language=None):
             """Compatibility wrapper for old load_translations method"""
-            if source_language is None and target_language is None:
-                # Return all translations flattened (for compatibility)
-                stats = self.manager.get_translation_stats()
-                all_translations = []
-                
-                pairs = self.manager.get_all_language_pairs()
-                for pair in pairs:
-                    source, target = pair.split('-')
-                    translations = self.manager.get_language_pair(source, target)
-                    all_translations.extend(translations)
-                
-                return all_translations
-            elif source_language is not None and target_language is not None:
+            if source_language is not None and target_language is not None:
                 # Get specific language pair
                 return self.manager.get_language_pair(source_language, target_language)
-            else:
-                # Filter by source or target only (less efficient but for compatibility)
-                all_translations = []
-                pairs = self.manager.get_all_language_pairs()
-                
-                for pair in pairs:
-                    source, target = pair.split('-')
-                    
-                    if (source_language is None or source == source_language) and \
-                       (target_language is None or target == target_language):
-                        translations = self.manager.get_language_pair(source, target)
-                        all_translations.extend(translations)
+            
+            # Flatten every matching pair from a single read of the file, rather
+            # than re-reading it once for the pair list and again for each pair
+            all_translations = []
+            structured_data = self.manager._load_structured_data()
+            
+            for pair_key, translations in sorted(structured_data.items()):
+                source, _, target = pair_key.partition('-')
                 
-                return all_translations
+                if (source_language is None or source == source_language) and \
+                   (target_language is None or target == target_language):
+                    # Copy the entries, as the structured data is the manager's cache
+                    all_translations.extend(map(dict, translations))
+            
+            return all_translations
         
         def save_translations(self, translations, source_language=None, target_language=None, force=False):
             """Compatibility wrapper for old save_translations method"""
@@ -451,23 +676,15 @@ def get_legacy_compatible_manager():
                 logger.warning("Using legacy save_translations without language pair - converting to structured format")
                 
                 # Group translations by language pair
-                structured_data = {}
+                structured_data = defaultdict(list)
                 for trans in translations:
                     source = trans.get('source_language')
                     target = trans.get('target_language')
                     
                     if source and target:
-                        pair_key = f"{source}-{target}"
-                        if pair_key not in structured_data:
-                            structured_data[pair_key] = []
-                        structured_data[pair_key].append(trans)
+                        structured_data[f"{source}-{target}"].append(trans)
                 
-                # Save each pair individually
-                for pair_key, pair_translations in structured_data.items():
-                    source, target = pair_key.split('-')
-                    if not self.manager.save_language_pair(pair_translations, source, target, force):
-                        return False
-                
-                return True
+                # Save all pairs with one backup and one write
+                return self.manager.save_language_pairs(structured_data, force)
     
     return LegacyCompatibleManager(manager)
\ No newline at end of file